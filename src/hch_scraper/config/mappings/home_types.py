@@ -1,4 +1,7 @@
-home_type_map = {
+import sys
+from types import MappingProxyType
+
+_raw_home_type_map = {
     "100": "Vacant Land",
     "101": "Cash - Grain Or General Farm",
     "102": "Livestock Farm Except Dairy & Poultry",
@@ -165,3 +168,4 @@ home_type_map = {
     "880": "Utilities Other Than Railroads, Personal Property",
     "881": "Public Utility Personal Property",
 }
+home_type_map = MappingProxyType({sys.intern(k): v for k, v in _raw_home_type_map.items()})
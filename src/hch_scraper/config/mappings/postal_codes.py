@@ -1,5 +1,5 @@
 zip_code_map = {
-    "CINCINNATI CSD": [
+    "CINCINNATI CSD": (
         45202,
         45203,
         45204,
@@ -34,15 +34,15 @@ zip_code_map = {
         45243,
         45244,
         45248,
-    ],
-    "DEER PARK CSD": [45242, 45236],
-    "FINNEYTOWN LSD": [45232, 45231, 45224, 45216, 45215],
-    "FOREST HILLS LSD": [45226, 45230, 45244, 45255],
-    "INDIAN HILL EVSD": [45111, 45140, 45147, 45150, 45236, 45242, 45243, 45249],
-    "LOCKLAND CSD": [45216, 45215],
-    "LOVELAND CSD": [45140, 45249],
-    "NORTH COLLEGE HILL CSD": [45224, 45231, 45239],
-    "NORTHWEST LSD (HAMILTON CO.)": [
+    ),
+    "DEER PARK CSD": (45242, 45236),
+    "FINNEYTOWN LSD": (45232, 45231, 45224, 45216, 45215),
+    "FOREST HILLS LSD": (45226, 45230, 45244, 45255),
+    "INDIAN HILL EVSD": (45111, 45140, 45147, 45150, 45236, 45242, 45243, 45249),
+    "LOCKLAND CSD": (45216, 45215),
+    "LOVELAND CSD": (45140, 45249),
+    "NORTH COLLEGE HILL CSD": (45224, 45231, 45239),
+    "NORTHWEST LSD (HAMILTON CO.)": (
         45002,
         45014,
         45211,
@@ -53,19 +53,19 @@ zip_code_map = {
         45247,
         45251,
         45252,
-    ],
-    "NORWOOD CSD": [45207, 45208, 45209, 45212, 45229],
-    "MADEIRA CSD": [45227, 45236, 45243],
-    "MARIEMONT CSD": [45174, 45226, 45227, 45243],
-    "MILFORD CSD": [45140, 45147, 45150, 45174, 45243, 45244],
-    "MOUNT HEALTHY CSD": [45218, 45231, 45240, 45251],
-    "OAK HILLS LSD": [45002, 45051, 45204, 45211, 45233, 45238, 45247, 45248],
-    "PRINCETON CSD": [45040, 45069, 45215, 45240, 45241, 45242, 45246, 45249],
-    "READING CSD": [45215, 45236, 45237],
-    "SOUTHWEST LSD (HAMILTON CO.)": [45002, 45013, 45030, 45033, 45041, 45052, 45053],
-    "ST. BERNARD-ELMWOOD PLACE CSD": [45216, 45217, 45229],
-    "SYCAMORE CSD": [45140, 45236, 45241, 45242, 45249],
-    "THREE RIVERS LSD": [45001, 45002, 45052, 45233, 45248],
-    "WINTON WOODS CSD": [45215, 45218, 45231, 45240, 45246],
-    "WYOMING CSD": [45215, 45216],
+    ),
+    "NORWOOD CSD": (45207, 45208, 45209, 45212, 45229),
+    "MADEIRA CSD": (45227, 45236, 45243),
+    "MARIEMONT CSD": (45174, 45226, 45227, 45243),
+    "MILFORD CSD": (45140, 45147, 45150, 45174, 45243, 45244),
+    "MOUNT HEALTHY CSD": (45218, 45231, 45240, 45251),
+    "OAK HILLS LSD": (45002, 45051, 45204, 45211, 45233, 45238, 45247, 45248),
+    "PRINCETON CSD": (45040, 45069, 45215, 45240, 45241, 45242, 45246, 45249),
+    "READING CSD": (45215, 45236, 45237),
+    "SOUTHWEST LSD (HAMILTON CO.)": (45002, 45013, 45030, 45033, 45041, 45052, 45053),
+    "ST. BERNARD-ELMWOOD PLACE CSD": (45216, 45217, 45229),
+    "SYCAMORE CSD": (45140, 45236, 45241, 45242, 45249),
+    "THREE RIVERS LSD": (45001, 45002, 45052, 45233, 45248),
+    "WINTON WOODS CSD": (45215, 45218, 45231, 45240, 45246),
+    "WYOMING CSD": (45215, 45216),
 }
@@ -1,3 +1,6 @@
+import sys
+from types import MappingProxyType
+
 school_city_map = {
     "CINCINNATI CSD": "Cincinnati",
     "DEER PARK CSD": "Cincinnati",
@@ -24,7 +27,7 @@ school_city_map = {
     "WYOMING CSD": "Wyoming",
 }
 
-district_idn_map = {
+_raw_district_idn_map = {
     "CINCINNATI CSD": "043752",
     "DEER PARK CSD": "043851",
     "FINNEYTOWN LSD": "047332",
@@ -49,3 +52,4 @@ district_idn_map = {
     "WINTON WOODS CSD": "044081",
     "WYOMING CSD": "045146",
 }
+district_idn_map = MappingProxyType({sys.intern(k): v for k, v in _raw_district_idn_map.items()})
@@ -1,6 +1,9 @@
-apt_head_works = {"#", "APT", "UNIT", "STE", "SUITE", "ROOM", "RM"}
+from types import MappingProxyType
+from typing import Final, Mapping
 
-spelled_out_numbers = {
+apt_head_works: Final[frozenset[str]] = frozenset({"#", "APT", "UNIT", "STE", "SUITE", "ROOM", "RM"})
+
+spelled_out_numbers: Final[frozenset[str]] = frozenset({
     # cardinal numbers
     "zero",
     "one",
@@ -58,7 +61,7 @@ spelled_out_numbers = {
     "seventieth",
     "eightieth",
     "ninetieth",
-}
+})
 
 secondary_unit_abbrev_map: dict[str, str] = {
     "APARTMENT": "APT",
@@ -188,7 +191,9 @@ secondary_unit_type_map: dict[str, str] = {
 }
 
 # messy unit token → USPS abbreviation (APT, STE, etc.)
-secondary_unit_normalization_map: dict[str, str] = {
-    variant: secondary_unit_abbrev_map[canonical]
+# Keys are stored the way callers look them up (upper-case, trailing "."
+# stripped), and the mapping is read-only so it can't drift at runtime.
+secondary_unit_normalization_map: Mapping[str, str] = MappingProxyType({
+    variant.rstrip(".").upper(): secondary_unit_abbrev_map[canonical]
     for variant, canonical in secondary_unit_type_map.items()
-}
+})
@@ -1,3 +1,6 @@
+from types import MappingProxyType
+from typing import Mapping
+
 # Maps *every* commonly-seen spelling / abbreviation → canonical USPS suffix
 street_type_map: dict[str, str] = {
     # ――― A ―――
@@ -821,15 +824,18 @@ _suffix_abbrev_fallbacks: dict[str, str] = {
     "SPURS": "SPUR",
 }
 
-# Fully normalized: messy input token → USPS suffix abbreviation
-street_suffix_normalization_map: dict[str, str] = {}
+# Fully normalized: messy input token → USPS suffix abbreviation.
+# Keys are pre-normalized (upper-case, trailing "." stripped) to match the
+# lookup in normalize_address_parts, and the result is read-only.
+_suffix_normalization: dict[str, str] = {}
 for variant, canonical in street_type_map.items():
     abbr = (
         canonical_to_abbrev.get(canonical)
         or _suffix_abbrev_fallbacks.get(canonical)
         or canonical
     )
-    street_suffix_normalization_map[variant] = abbr
+    _suffix_normalization[variant.rstrip(".").upper()] = abbr
+street_suffix_normalization_map: Mapping[str, str] = MappingProxyType(_suffix_normalization)
 
 direction_map = {
     "N": "NORTH",
@@ -905,9 +911,9 @@ direction_full_to_abbrev: dict[str, str] = {
 }
 
 # Normalize any direction-ish token to USPS abbreviation
-direction_normalization_map: dict[str, str] = {
+direction_normalization_map: Mapping[str, str] = MappingProxyType({
     # already-abbrev inputs
     **{abbr: abbr for abbr in direction_abbrev_to_full},
     # full-word inputs
     **direction_full_to_abbrev,
-}
+})
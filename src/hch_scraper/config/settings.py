@@ -1,32 +1,86 @@
+import copy
+import importlib
+import sys
 import yaml
+from functools import lru_cache
 from pathlib import Path
+from types import MappingProxyType
+
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader
 
 CONFIG_PATH = Path(__file__).parent / "selectors/xpaths.yaml"
 
 
 # Loading XPaths and other settings from YAML file
-def load_config(file_path):
-    with open(file_path, "r") as file:
-        return yaml.safe_load(file)
+@lru_cache(maxsize=None)
+def _parse_config(file_path):
+    # Bytes let libyaml detect the encoding itself instead of us decoding first.
+    with open(file_path, "rb") as file:
+        return yaml.load(file, Loader=SafeLoader)
 
 
-XPATHS = load_config(CONFIG_PATH)
+def load_config(file_path):
+    """
+    Parse `file_path` as YAML. The parse is memoized per path; each caller
+    gets its own copy so no one can mutate another caller's config.
+    """
+    return copy.deepcopy(_parse_config(Path(file_path).resolve()))
+
+
+def _form_xpaths_list(xpaths):
+    # Form elements used in multiple scrapers
+    return [
+        # xpaths["search"]["conventional_home_type"],
+        xpaths["search"]["form_search_button"]
+    ]
+
+
+# Mapping tables re-exported from here, imported on first access:
+# name → module under hch_scraper.config.mappings
+_LAZY_MAPPINGS = {
+    # Normalized street suffix mapping
+    "street_type_map": "street_types",
+    # School district mappings
+    "school_city_map": "school_districts",
+    # Postal code mappings
+    "zip_code_map": "postal_codes",
+}
+
 
-# Form elements used in multiple scrapers
-form_xpaths_list = [
-    # XPATHS["search"]["conventional_home_type"],
-    XPATHS["search"]["form_search_button"]
-]
+def __getattr__(name):
+    """
+    Parse xpaths.yaml on first access to XPATHS / form_xpaths_list rather
+    than at import, so code paths that never drive a browser skip it. The
+    mapping tables in _LAZY_MAPPINGS are likewise imported on first use.
+    """
+    if name in _LAZY_MAPPINGS:
+        module = importlib.import_module(
+            f"hch_scraper.config.mappings.{_LAZY_MAPPINGS[name]}"
+        )
+        value = getattr(module, name)
+    elif name == "XPATHS":
+        value = load_config(CONFIG_PATH)
+    elif name == "form_xpaths_list":
+        value = _form_xpaths_list(__getattr__("XPATHS"))
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
 
 # Web and API endpoints
 URLS = {
     "base": "https://www.hamiltoncountyauditor.org",
     "robots": "https://www.hamiltoncountyauditor.org/robots.txt",
+    "geocoding_api": "http://api.positionstack.com/v1/forward",
 }
 
 CACHE_PATHS = {
-    "geocoding_cache": "data/processed/geocode_cache.json",
+    "geocoding_cache": "data/processed/geocode_cache.sqlite3",
     "address_parts_cache": "data/processed/address_parts_cache.json",
+    "scrape_windows": "data/cache/scrape_windows/",
 }
 
 # Retry and timeout settings, all in seconds
@@ -51,15 +105,16 @@ data_storage = {
 map_center = dict(lat=39.2127649, lon=-84.3831728)
 
 
-colorscale = {
+_raw_colorscale = {
     "044867": "rgba(0, 38, 66,.1)",
     "045146": "rgba(132, 0, 50,.1)",
     "044289": "rgba(0, 187, 249,.1)",
     "044313": "rgba(0, 245, 212,.1)",
     "044271": "rgba(175, 43, 191,.1)",
 }
+colorscale = MappingProxyType({sys.intern(k): v for k, v in _raw_colorscale.items()})
 
-district_color_map = {
+_raw_district_color_map = {
     "SYCAMORE CSD": " rgba(132, 0, 50,1)",
     "WYOMING CSD": "rgba(0, 38, 66,1)",
     "MADEIRA CSD": "rgba(0, 187, 249,1)",
@@ -67,16 +122,8 @@ district_color_map = {
     "LOVELAND CSD": "rgba(175, 43, 191,1)",
     # Add more districts and colors as needed
 }
+district_color_map = MappingProxyType({sys.intern(k): v for k, v in _raw_district_color_map.items()})
 
 
 CLUSTER_MIN_SIZE = 5
 CLUSTER_MIN_SAMPLES = 1
-
-# Normalized street suffix mapping
-from hch_scraper.config.mappings.street_types import street_type_map
-
-# School district mappings
-from hch_scraper.config.mappings.school_districts import school_city_map
-
-# Postal code mappings
-from hch_scraper.config.mappings.postal_codes import zip_code_map
@@ -13,9 +13,12 @@ Usage:
     driver, wait = init_driver("https://example.com", driver_type="firefox")
 """
 
+import re
 import time
-from urllib.parse import urlparse
+from functools import lru_cache
 from pathlib import Path
+from types import MappingProxyType
+from typing import Callable, Mapping
 
 from selenium import webdriver
 from selenium.webdriver.support.wait import WebDriverWait
@@ -29,6 +32,9 @@ from hch_scraper.config.settings import SCRAPING_CONFIG, data_storage
 MAX_RETRIES = SCRAPING_CONFIG["retry_limit"]
 TIMEOUT = SCRAPING_CONFIG["page_load_timeout"]
 
+# scheme "://" followed by a non-empty authority
+_URL_RE = re.compile(r"^[A-Za-z][A-Za-z0-9+.\-]*://[^\s/?#]+")
+
 
 def is_valid_url(url: str) -> bool:
     """
@@ -40,8 +46,76 @@ def is_valid_url(url: str) -> bool:
     Returns:
         bool: True if valid, False otherwise.
     """
-    parsed = urlparse(url)
-    return bool(parsed.netloc) and bool(parsed.scheme)
+    return _URL_RE.match(url) is not None
+
+
+@lru_cache(maxsize=1)
+def _download_dir() -> Path:
+    """
+    Resolve and create the raw-data download directory once per process.
+
+    Returns:
+        Path: Absolute path browsers should save downloads into.
+    """
+    download_dir = Path(data_storage["raw"]).resolve()
+    download_dir.mkdir(parents=True, exist_ok=True)
+    return download_dir
+
+
+def _make_firefox(headless: bool, download_dir: str) -> tuple:
+    """
+    Build Firefox options with CSV download preferences.
+
+    Args:
+        headless (bool): Run browser in headless mode.
+        download_dir (str): Directory downloads are saved into.
+
+    Returns:
+        tuple: (options: FirefoxOptions, driver_cls: type[webdriver.Firefox])
+    """
+    options = webdriver.FirefoxOptions()
+    if headless:
+        options.add_argument("--headless")
+
+    # Set Firefox download preferences
+    options.set_preference("browser.download.folderList", 2)
+    options.set_preference("browser.download.dir", download_dir)
+    options.set_preference(
+        "browser.helperApps.neverAsk.saveToDisk", "text/csv,application/csv"
+    )
+    return options, webdriver.Firefox
+
+
+def _make_chrome(headless: bool, download_dir: str) -> tuple:
+    """
+    Build Chrome options with download preferences.
+
+    Args:
+        headless (bool): Run browser in headless mode.
+        download_dir (str): Directory downloads are saved into.
+
+    Returns:
+        tuple: (options: ChromeOptions, driver_cls: type[webdriver.Chrome])
+    """
+    options = webdriver.ChromeOptions()
+    if headless:
+        options.add_argument("--headless")
+
+    # Set Chrome download preferences
+    prefs = {
+        "download.default_directory": download_dir,
+        "download.prompt_for_download": False,
+        "safebrowsing.enabled": True,
+    }
+    options.add_experimental_option("prefs", prefs)
+    return options, webdriver.Chrome
+
+
+# Supported driver types → factory returning (options, driver class)
+_DRIVERS: Mapping[str, Callable[[bool, str], tuple]] = MappingProxyType({
+    "firefox": _make_firefox,
+    "chrome": _make_chrome,
+})
 
 
 def init_driver(
@@ -73,55 +147,29 @@ def init_driver(
         logger.error(f"Invalid URL provided: {base_url}")
         raise ValueError(f"Invalid URL: {base_url}")
 
+    driver_type = driver_type.lower()
+    if driver_type not in _DRIVERS:
+        raise ValueError(f"Unsupported driver type: {driver_type}")
+
     driver = None
-    download_dir = Path(data_storage["raw"]).resolve()
-    download_dir.mkdir(parents=True, exist_ok=True)
+    # Fresh options per session; building them is trivial next to a browser launch.
+    options, driver_cls = _DRIVERS[driver_type](headless, str(_download_dir()))
 
     for attempt in range(max_retries):
         try:
-            if driver_type.lower() == "firefox":
-                options = webdriver.FirefoxOptions()
-                if headless:
-                    options.add_argument("--headless")
-
-                # Set Firefox download preferences
-                options.set_preference("browser.download.folderList", 2)
-                options.set_preference("browser.download.dir", str(download_dir))
-                options.set_preference(
-                    "browser.helperApps.neverAsk.saveToDisk", "text/csv,application/csv"
-                )
-
-                driver = webdriver.Firefox(options=options)
-
-            elif driver_type.lower() == "chrome":
-                options = webdriver.ChromeOptions()
-                if headless:
-                    options.add_argument("--headless")
-
-                # Set Chrome download preferences
-                prefs = {
-                    "download.default_directory": str(download_dir),
-                    "download.prompt_for_download": False,
-                    "safebrowsing.enabled": True,
-                }
-                options.add_experimental_option("prefs", prefs)
-
-                driver = webdriver.Chrome(options=options)
-
-            else:
-                raise ValueError(f"Unsupported driver type: {driver_type}")
-
+            driver = driver_cls(options=options)
             driver.get(base_url)
             logger.info(f"Driver initialized and navigated to {base_url}")
             return driver, WebDriverWait(driver, timeout)
 
         except (WebDriverException, TimeoutException) as e:
             logger.warning(f"Attempt {attempt + 1} failed: {e}")
-            time.sleep(2)
-
-    # If initialization failed after retries, clean up
-    if driver:
-        safe_quit(driver)
+            if driver:
+                safe_quit(driver)
+                driver = None
+            if attempt + 1 < max_retries:
+                # Exponential backoff: 0.25s, 0.5s, 1s, ... capped at 8s.
+                time.sleep(min(0.25 * (1 << attempt), 8))
 
     logger.error("Failed to initialize WebDriver after all retry attempts.")
     raise WebDriverException("Failed to initialize WebDriver.")
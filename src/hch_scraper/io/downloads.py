@@ -16,18 +16,22 @@ Modules:
 - scrape_summary_pages: Iterate and collect paginated summary tables
 - scrape_detail_pages: Iterate and collect detailed property pages
 - get_csv_data: Wait for CSV download, read, and cleanup
+- load_cached_window / cache_window: Opt-in reuse of settled search results per date window
 - scrape_data: Aggregate summary and detail scraping routines
 
 Configuration, logging, and XPATH settings are imported from hch_scraper utilities.
 """
 import glob
+import hashlib
 import os
 import time
 import random
 import re
 import math
+from datetime import date, datetime
 import pandas as pd
 from pathlib import Path
+from typing import Optional
 
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support import expected_conditions as EC
@@ -36,7 +40,7 @@ from selenium.webdriver.support import expected_conditions as EC
 from hch_scraper.utils.logging_setup import logger
 
 # Application settings (XPATH definitions)
-from hch_scraper.config.settings import XPATHS, data_storage
+from hch_scraper.config.settings import CACHE_PATHS, XPATHS, data_storage
 
 # Helpers for text extraction, table scraping, and navigation
 from hch_scraper.utils.data_extraction.form_helpers.selenium_utils import get_text
@@ -333,6 +337,98 @@ def get_csv_data(wait, max_wait=30) -> pd.DataFrame:
     return df
 
 
+# Where per-window search results are kept, and how long they stay valid
+WINDOW_CACHE_DIR = CACHE_PATHS["scrape_windows"]
+WINDOW_CACHE_MAX_AGE = 2 * 24 * 60 * 60
+# Opt-in: set to 1/true/yes to reuse downloaded windows across runs.
+WINDOW_CACHE_ENV = "HCH_SCRAPER_WINDOW_CACHE"
+# Sales can be recorded days after the transfer date, so windows ending
+# this recently are always scraped fresh and never cached.
+WINDOW_CACHE_SETTLE_DAYS = 7
+
+
+def window_cache_enabled() -> bool:
+    """True when the per-window results cache is switched on via WINDOW_CACHE_ENV."""
+    return os.getenv(WINDOW_CACHE_ENV, "").strip().lower() in ("1", "true", "yes")
+
+
+def _window_is_settled(end: str) -> bool:
+    # end is MM/DD/YYYY, as produced by _initialize_ranges
+    try:
+        end_date = datetime.strptime(end, "%m/%d/%Y").date()
+    except ValueError:
+        return False
+    return (date.today() - end_date).days > WINDOW_CACHE_SETTLE_DAYS
+
+
+def _window_cache_path(start: str, end: str) -> Path:
+    key = hashlib.sha1(f"{start}-{end}".encode()).hexdigest()
+    return Path(WINDOW_CACHE_DIR) / f"{key}.csv"
+
+
+def _purge_expired_windows(max_age_seconds: int) -> None:
+    # Drop cache files older than max_age_seconds so the directory can't grow forever.
+    cutoff = time.time() - max_age_seconds
+    for path in Path(WINDOW_CACHE_DIR).glob("*.csv"):
+        try:
+            if path.stat().st_mtime < cutoff:
+                path.unlink()
+        except OSError as e:
+            logger.warning("Could not remove expired window cache %s: %s", path, e)
+
+
+def load_cached_window(
+    start: str, end: str, max_age_seconds: int = WINDOW_CACHE_MAX_AGE
+) -> Optional[pd.DataFrame]:
+    """
+    Return the search results saved for the [start, end] window, or None if
+    the cache is disabled, the window is too recent to trust, or there are
+    no results younger than `max_age_seconds`. Expired entries are deleted.
+
+    Args:
+        start (str): Window start date (MM/DD/YYYY).
+        end (str): Window end date (MM/DD/YYYY).
+        max_age_seconds (int): Oldest cache entry still accepted.
+
+    Returns:
+        Optional[pd.DataFrame]: Cached results, or None on a miss.
+    """
+    if not window_cache_enabled():
+        return None
+    _purge_expired_windows(max_age_seconds)
+    if not _window_is_settled(end):
+        return None
+
+    path = _window_cache_path(start, end)
+    if not path.exists():
+        return None
+
+    try:
+        return pd.read_csv(path)
+    except Exception as e:
+        logger.warning("Ignoring unreadable window cache %s: %s", path, e)
+        return None
+
+
+def cache_window(start: str, end: str, df: pd.DataFrame) -> None:
+    """
+    Save the search results for the [start, end] window for load_cached_window.
+    Does nothing when the cache is disabled or the window ends within
+    WINDOW_CACHE_SETTLE_DAYS of today.
+
+    Args:
+        start (str): Window start date (MM/DD/YYYY).
+        end (str): Window end date (MM/DD/YYYY).
+        df (pd.DataFrame): Results as returned by get_csv_data.
+    """
+    if df.empty or not window_cache_enabled() or not _window_is_settled(end):
+        return
+    path = _window_cache_path(start, end)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    _purge_expired_windows(WINDOW_CACHE_MAX_AGE)
+    df.to_csv(path, index=False)
+
+
 def _purge_existing_csvs(pattern):
     # Removes any .csv files that would keep the scraper from working properly
     for f in glob.glob(str(pattern)):
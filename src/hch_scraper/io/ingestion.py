@@ -2,10 +2,34 @@ from __future__ import annotations
 
 from typing import List
 
+import numpy as np
 import pandas as pd
 from supabase import Client
 
-from hch_scraper.loaders.supabase_loader import make_record_key, make_row_hash
+from hch_scraper.loaders.supabase_loader import make_keys_frame
+
+
+def null_non_finite(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Object-dtype copy of `df` with NaN/NaT/None and +/-inf cells set to None,
+    ready for JSON.
+
+    Float columns are checked with one np.isfinite pass each; every other
+    column only needs notna(), so no per-cell dict lookup is done.
+
+    Args:
+        df: Frame to clean.
+
+    Returns:
+        Cleaned object-dtype copy of `df`.
+    """
+    keep = np.empty(df.shape, dtype=bool)
+    for i, (_, col) in enumerate(df.items()):
+        if col.dtype.kind == "f":
+            keep[:, i] = np.isfinite(col.to_numpy(dtype="float64", na_value=np.nan))
+        else:
+            keep[:, i] = col.notna().to_numpy()
+    return df.astype(object).where(keep, None)
 
 
 def upsert_sales_raw(
@@ -17,16 +41,23 @@ def upsert_sales_raw(
     batch_size: int = 500,
 ) -> int:
     """
-    Upsert cleaned sales data into the Supabase raw.sales_hamilton table.
+    Upsert cleaned sales data into bronze.sales_hamilton through the
+    upsert_sales_hamilton RPC, one call per row.
+
+    The RPC owns change detection on row_hash and the server-managed
+    columns (first_seen_at, last_seen_at, updated_at, update_type,
+    changed_fields, geom), so rows go through it rather than a plain
+    table upsert. Keys are hashed for the whole frame up front and rows
+    are converted to dicts `batch_size` at a time.
 
     Args:
         df: Cleaned pandas DataFrame with columns like:
             Parcel Number, Address, BBB, FinSqFt, Use, Year Built,
             Transfer Date, Amount.
         supabase: An authenticated Supabase Client (service-role).
-        table_name: Target table, including schema if used.
-                    Default: 'bronze.sales_hamilton'.
-        batch_size: Number of rows per upsert batch (to avoid huge payloads).
+        schema_name: Schema holding the target table. Default: 'bronze'.
+        table_name: Target table. Default: 'sales_hamilton'.
+        batch_size: Rows converted to payload dicts at a time.
 
     Returns:
         Total number of rows attempted to upsert.
@@ -34,22 +65,24 @@ def upsert_sales_raw(
     if df.empty:
         return 0
 
-    df = df.drop_duplicates().loc[lambda d: d["parcel_number"].notna()]
+    df = df.drop_duplicates().loc[lambda d: d["parcel_number"].notna()].copy()
     df.columns = df.columns.str.lower()
 
-    records: List[dict] = df.to_dict(orient="records")
+    df["record_key"], df["row_hash"] = make_keys_frame(df)
 
+    # Convert one batch at a time so only batch_size rows are ever boxed
+    # into Python dicts, rather than the whole frame up front.
     total = 0
-    for r in records:
-        r["record_key"] = make_record_key(r)
-        r["row_hash"] = make_row_hash(r)
-        response = supabase.rpc("upsert_sales_hamilton", {"p": r}).execute()
+    for start in range(0, len(df), batch_size):
+        chunk: List[dict] = df.iloc[start : start + batch_size].to_dict(
+            orient="records"
+        )
+        for r in chunk:
+            response = supabase.rpc("upsert_sales_hamilton", {"p": r}).execute()
 
-        # Optionally check for errors
-        if getattr(response, "error", None):
-            # You can swap print for logging here
-            raise RuntimeError(f"Supabase upsert error: {response.error}")
+            if getattr(response, "error", None):
+                raise RuntimeError(f"Supabase upsert error: {response.error}")
 
-        total += 1
+        total += len(chunk)
 
     return total
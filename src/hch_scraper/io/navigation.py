@@ -1,4 +1,6 @@
 import time
+from functools import lru_cache
+from typing import Callable
 from urllib.robotparser import RobotFileParser
 
 import sys
@@ -7,6 +9,7 @@ import selenium.webdriver
 
 # Selenium-related imports
 from selenium.webdriver.common.by import By
+from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.support.wait import WebDriverWait
 from selenium.common.exceptions import (
     NoSuchElementException,
@@ -40,11 +43,20 @@ class SafeClickError(Exception):
 # ----------------------------------------
 
 
+@lru_cache(maxsize=None)
+def _clickable(xpath: str) -> Callable:
+    """
+    Return a reusable element_to_be_clickable condition for `xpath`.
+
+    The condition holds no per-call state, so one instance per XPath is
+    shared across retries and across every click on that element.
+    """
+    return EC.element_to_be_clickable((By.XPATH, xpath))
+
+
 def safe_click(
     wait: WebDriverWait, xpath: str, retries: int = 3, delay: int = 1, log: bool = True
 ) -> bool:
-    from selenium.webdriver.support import expected_conditions as EC
-
     """
     Clicks an element located by its XPath with retries and optional logging.
 
@@ -61,9 +73,10 @@ def safe_click(
     Raises:
         SafeClickError: If the element could not be clicked after all retries.
     """
+    condition = _clickable(xpath)
     for attempt in range(1, retries + 1):
         try:
-            element = wait.until(EC.element_to_be_clickable((By.XPATH, xpath)))
+            element = wait.until(condition)
             element.click()
             if log:
                 logger.info(f"Successfully clicked element at {xpath}.")
@@ -134,6 +147,40 @@ def initialize_search(wait: WebDriverWait, start: str, end: str) -> None:
         safe_click(wait, xpath)
 
 
+def wait_for_search_results(wait: WebDriverWait) -> None:
+    """
+    Block until the search results status line ("Showing x to y of z entries")
+    is on the page, instead of sleeping a fixed interval after the search.
+
+    Args:
+        wait (WebDriverWait): WebDriverWait instance to control interactions.
+
+    Behavior:
+        - Returns as soon as the results info element is present.
+        - Logs and returns on timeout; check_reset_needed retries the count.
+    """
+    try:
+        wait.until(
+            EC.presence_of_element_located(
+                (By.XPATH, XPATHS["results"]["search_results_number"])
+            )
+        )
+    except TimeoutException:
+        logger.warning("Search results did not appear before the wait timed out.")
+
+
+@lru_cache(maxsize=4)
+def _robots_parser(url: str, day_bucket: int) -> RobotFileParser:
+    """
+    Fetch and parse `url` once per `day_bucket` (days since the epoch), so
+    robots.txt is re-read at most daily.
+    """
+    rp = RobotFileParser()
+    rp.set_url(url)
+    rp.read()
+    return rp
+
+
 def check_allowed_webscraping(driver) -> bool:
     """
     Validates whether web scraping is allowed for the site based on `robots.txt`.
@@ -145,20 +192,18 @@ def check_allowed_webscraping(driver) -> bool:
         bool: True if scraping is allowed, False otherwise.
 
     Behavior:
-        - Parses the site's `robots.txt` file.
+        - Parses the site's `robots.txt` file (cached for the day).
         - Quits the driver and logs if scraping is disallowed.
     """
     ROBOTS_TXT_URL = URLS["robots"]
     BASE_URL = URLS["base"]
 
-    rp = RobotFileParser()
-    rp.set_url(ROBOTS_TXT_URL)
-    rp.read()
+    rp = _robots_parser(ROBOTS_TXT_URL, int(time.time() // 86400))
 
     if rp.can_fetch("*", BASE_URL):
         logger.info(f"Scraping allowed for {BASE_URL}")
         return True
     else:
-        print(f"Scraping NOT allowed for {BASE_URL}")
+        logger.warning(f"Scraping NOT allowed for {BASE_URL}")
         driver.quit()
         return False
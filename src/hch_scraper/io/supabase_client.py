@@ -1,11 +1,18 @@
 from __future__ import annotations
 
 import os
+from functools import lru_cache
 from typing import Optional
 
 from supabase import Client, create_client
 
 
+@lru_cache(maxsize=4)
+def _client_for(supabase_url: str, supabase_key: str) -> Client:
+    # One client (and HTTP session) per URL/key pair for the process.
+    return create_client(supabase_url, supabase_key)
+
+
 def get_supabase_client(
     url: Optional[str] = None,
     service_role_key: Optional[str] = None,
@@ -23,7 +30,8 @@ def get_supabase_client(
           service_role_key: Optional override for the service role key.
 
       Returns:
-          Supabase Client instance.
+          Supabase Client instance, shared by every call with the same
+          URL and key.
 
       Raises:
           RuntimeError: If URL or key are missing.
@@ -37,4 +45,4 @@ def get_supabase_client(
             "Set SUPABASE_URL and SUPABASE_SERVICE_ROLE_KEY in your environment."
         )
 
-    return create_client(supabase_url, supabase_key)
+    return _client_for(supabase_url, supabase_key)
@@ -8,33 +8,46 @@ set +a
 QUERY_URL="https://services.arcgis.com/JyZag7oO4NteHGiq/arcgis/rest/services/OpenData/FeatureServer/10/query"
 OUT_DIR="geojson"
 PAGE_FILE="${OUT_DIR}/cagis_parcels_layer_page.geojson"
+NEXT_PAGE_FILE="${OUT_DIR}/cagis_parcels_layer_page_next.geojson"
 PAGE_SIZE=2000
 
 mkdir -p "$OUT_DIR"
 
 PG_CONN="PG:host=${SUPABASE_DB_HOST} port=${SUPABASE_DB_PORT} dbname=${SUPABASE_DB_NAME} user=${SUPABASE_DB_USER} password=${SUPABASE_DB_PASSWORD} sslmode=require"
 
+# Stream features with COPY instead of one INSERT per feature. GDAL only
+# does this on its own for freshly created tables, not for -append pages.
+# The ogr2ogr calls also pass -gt unlimited so each page is a single
+# transaction instead of a commit every 100 features.
+export PG_USE_COPY=YES
+
 # Some GDAL builds are inconsistent with -overwrite for PostgreSQL layers.
 # Drop first so the create step is deterministic.
 ogrinfo "$PG_CONN" -q -sql "DROP TABLE IF EXISTS bronze.cagis_parcels_layer_raw CASCADE"
 
+# Download one page to $2 starting at offset $1; the HTTP status is written
+# next to it in "$2.code".
+fetch_page() {
+  curl -sS -G "$QUERY_URL" \
+    --data-urlencode "where=1=1" \
+    --data-urlencode "outFields=*" \
+    --data-urlencode "returnGeometry=true" \
+    --data-urlencode "orderByFields=OBJECTID ASC" \
+    --data-urlencode "outSR=4326" \
+    --data-urlencode "f=geojson" \
+    --data-urlencode "resultOffset=$1" \
+    --data-urlencode "resultRecordCount=${PAGE_SIZE}" \
+    -o "$2" \
+    -w "%{http_code}" > "$2.code"
+}
+
 OFFSET=0
 PAGE_NUM=1
 
+fetch_page "$OFFSET" "$PAGE_FILE"
+
 while true; do
-  HTTP_CODE="$(
-    curl -sS -G "$QUERY_URL" \
-      --data-urlencode "where=1=1" \
-      --data-urlencode "outFields=*" \
-      --data-urlencode "returnGeometry=true" \
-      --data-urlencode "orderByFields=OBJECTID ASC" \
-      --data-urlencode "outSR=4326" \
-      --data-urlencode "f=geojson" \
-      --data-urlencode "resultOffset=${OFFSET}" \
-      --data-urlencode "resultRecordCount=${PAGE_SIZE}" \
-      -o "$PAGE_FILE" \
-      -w "%{http_code}"
-  )"
+  HTTP_CODE="$(cat "${PAGE_FILE}.code")"
 
   if [ "$HTTP_CODE" -ge 400 ]; then
     echo "ArcGIS request failed with HTTP $HTTP_CODE on page $PAGE_NUM (offset $OFFSET)" >&2
@@ -53,6 +66,14 @@ while true; do
     break
   fi
 
+  # Download the next page while this one is being written to Postgres so the
+  # network fetch and the COPY overlap.
+  NEXT_PID=""
+  if grep -Eq '"exceededTransferLimit"[[:space:]]*:[[:space:]]*true' "$PAGE_FILE"; then
+    fetch_page "$((OFFSET + PAGE_SIZE))" "$NEXT_PAGE_FILE" &
+    NEXT_PID=$!
+  fi
+
   if [ "$PAGE_NUM" -eq 1 ]; then
     ogr2ogr -f "PostgreSQL" \
       "$PG_CONN" \
@@ -62,8 +83,10 @@ while true; do
       -nln bronze.cagis_parcels_layer_raw \
       -lco OVERWRITE=YES \
       -lco GEOMETRY_NAME=geom \
+      -lco SPATIAL_INDEX=NONE \
       -nlt PROMOTE_TO_MULTI \
-      -t_srs EPSG:4326
+      -t_srs EPSG:4326 \
+      -gt unlimited
   else
     ogr2ogr -f "PostgreSQL" \
       "$PG_CONN" \
@@ -72,17 +95,29 @@ while true; do
       -append \
       -nln bronze.cagis_parcels_layer_raw \
       -nlt PROMOTE_TO_MULTI \
-      -t_srs EPSG:4326
+      -t_srs EPSG:4326 \
+      -gt unlimited
   fi
 
   echo "Loaded page $PAGE_NUM (offset $OFFSET)"
 
-  if ! grep -Eq '"exceededTransferLimit"[[:space:]]*:[[:space:]]*true' "$PAGE_FILE"; then
+  if [ -z "$NEXT_PID" ]; then
     break
   fi
 
+  wait "$NEXT_PID"
+
+  TMP_FILE="$PAGE_FILE"
+  PAGE_FILE="$NEXT_PAGE_FILE"
+  NEXT_PAGE_FILE="$TMP_FILE"
+
   OFFSET=$((OFFSET + PAGE_SIZE))
   PAGE_NUM=$((PAGE_NUM + 1))
 done
 
+# The table is created without a spatial index so appended pages skip the
+# per-row GiST maintenance; build it once over the full table instead.
+ogrinfo "$PG_CONN" -q -sql "CREATE INDEX cagis_parcels_layer_raw_geom_idx ON bronze.cagis_parcels_layer_raw USING GIST (geom)"
+ogrinfo "$PG_CONN" -q -sql "ANALYZE bronze.cagis_parcels_layer_raw"
+
 echo "PARCEL LOAD COMPLETE: bronze.cagis_parcels_layer_raw at $(date)"
@@ -16,6 +16,13 @@ ID_FIELD="OBJECTID"
 mkdir -p "$OUT_DIR" "$STATE_DIR"
 
 PG_CONN="PG:host=${SUPABASE_DB_HOST} port=${SUPABASE_DB_PORT} dbname=${SUPABASE_DB_NAME} user=${SUPABASE_DB_USER} password=${SUPABASE_DB_PASSWORD} sslmode=require"
+
+# Stream features with COPY instead of one INSERT per feature. GDAL only
+# does this on its own for freshly created tables, not for -append pages.
+# The ogr2ogr calls also pass -gt unlimited so each page is a single
+# transaction instead of a commit every 100 features.
+export PG_USE_COPY=YES
+
 TARGET_FULL_TABLE="bronze.cagis_parcels_layer_raw"
 
 LAST_OBJECTID=0
@@ -76,7 +83,8 @@ while true; do
       -lco SCHEMA=bronze \
       -lco GEOMETRY_NAME=geom \
       -nlt PROMOTE_TO_MULTI \
-      -t_srs EPSG:4326
+      -t_srs EPSG:4326 \
+      -gt unlimited
     TABLE_EXISTS=1
   else
     ogr2ogr -f "PostgreSQL" \
@@ -86,20 +94,21 @@ while true; do
       -append \
       -nln bronze.cagis_parcels_layer_raw \
       -nlt PROMOTE_TO_MULTI \
-      -t_srs EPSG:4326
+      -t_srs EPSG:4326 \
+      -gt unlimited
   fi
 
   ANY_LOADED=1
   echo "Loaded incremental page $PAGE_NUM (offset $OFFSET)"
 
+  # Scan the page for ID values instead of parsing the whole GeoJSON into
+  # memory; pages are large and only the max OBJECTID is needed here.
   PAGE_MAX="$(
-    python -c "import json,sys; d=json.load(open(sys.argv[1], encoding='utf-8')); vals=[]; 
-for f in d.get('features',[]): 
-    p=f.get('properties') or {}; 
-    v=p.get(sys.argv[2]); 
-    if isinstance(v, (int, float)) or (isinstance(v, str) and v.isdigit()): 
-        vals.append(int(v)); 
-print(max(vals) if vals else '')" "$PAGE_FILE" "$ID_FIELD"
+    grep -oE "\"${ID_FIELD}\"[[:space:]]*:[[:space:]]*\"?[0-9]+" "$PAGE_FILE" \
+      | grep -oE '[0-9]+$' \
+      | sort -n \
+      | tail -n 1 \
+      || true
   )"
 
   if [ -n "$PAGE_MAX" ]; then
@@ -1,69 +1,102 @@
 from hashlib import sha256
 
+import pandas as pd
 
-def _get(row: dict, *keys: str) -> str:
-    """Return the first present non-null value among keys as a stripped string."""
-    for k in keys:
-        v = row.get(k)
-        if v is not None and str(v).strip() != "":
-            return str(v).strip()
-    return ""
-
-
-def make_record_key(row: dict) -> str:
-    # Adjust these keys to match your DF columns
-    parcel = _get(row, "parcel_number")
-    transfer_date = _get(row, "transfer_date")
-
-    parts = [parcel, transfer_date]
-    return sha256("|".join(parts).encode("utf-8")).hexdigest()
-
-
-def make_row_hash(row: dict) -> str:
-    parts = [
-        _get(row, "parcel_number"),
-        _get(row, "address"),
-        _get(row, "bbb"),
-        _get(row, "finsqft"),
-        _get(row, "use"),
-        _get(row, "year_built"),
-        _get(row, "transfer_date"),
-        _get(row, "amount"),
-        _get(row, "recipient"),
-        _get(row, "addressnumber"),
-        _get(row, "addressnumberlow"),
-        _get(row, "addressnumberhigh"),
-        _get(row, "addressnumberprefix"),
-        _get(row, "addressnumbersuffix"),
-        _get(row, "streetname"),
-        _get(row, "streetnamepredirectional"),
-        _get(row, "streetnamepremodifier"),
-        _get(row, "streetnamepretype"),
-        _get(row, "streetnamepostdirectional"),
-        _get(row, "streetnamepostmodifier"),
-        _get(row, "streetnameposttype"),
-        _get(row, "cornerof"),
-        _get(row, "intersectionseparator"),
-        _get(row, "landmarkname"),
-        _get(row, "uspsboxgroupid"),
-        _get(row, "uspsboxgrouptype"),
-        _get(row, "uspsuspsboxid"),
-        _get(row, "uspsboxtype"),
-        _get(row, "buildingname"),
-        _get(row, "occupancytype"),
-        _get(row, "occupancyidentifier"),
-        _get(row, "subaddressidentifier"),
-        _get(row, "subaddresstype"),
-        _get(row, "placename"),
-        _get(row, "statename"),
-        _get(row, "addresstype"),
-        _get(row, "address_range_type"),
-        _get(row, "update_type"),
-        _get(row, "parcelid_join"),
-        _get(row, "amount_num"),
-        _get(row, "total_rooms"),
-        _get(row, "bedrooms"),
-        _get(row, "full_baths"),
-        _get(row, "half_baths"),
-    ]
-    return sha256("|".join(parts).encode("utf-8")).hexdigest()
+# Adjust these keys to match your DF columns
+RECORD_KEY_COLUMNS = ("parcel_number", "transfer_date")
+
+ROW_HASH_COLUMNS = (
+    "parcel_number",
+    "address",
+    "bbb",
+    "finsqft",
+    "use",
+    "year_built",
+    "transfer_date",
+    "amount",
+    "recipient",
+    "addressnumber",
+    "addressnumberlow",
+    "addressnumberhigh",
+    "addressnumberprefix",
+    "addressnumbersuffix",
+    "streetname",
+    "streetnamepredirectional",
+    "streetnamepremodifier",
+    "streetnamepretype",
+    "streetnamepostdirectional",
+    "streetnamepostmodifier",
+    "streetnameposttype",
+    "cornerof",
+    "intersectionseparator",
+    "landmarkname",
+    "uspsboxgroupid",
+    "uspsboxgrouptype",
+    "uspsuspsboxid",
+    "uspsboxtype",
+    "buildingname",
+    "occupancytype",
+    "occupancyidentifier",
+    "subaddressidentifier",
+    "subaddresstype",
+    "placename",
+    "statename",
+    "addresstype",
+    "address_range_type",
+    "update_type",
+    "parcelid_join",
+    "amount_num",
+    "total_rooms",
+    "bedrooms",
+    "full_baths",
+    "half_baths",
+)
+
+
+def _key_part(v) -> str:
+    """String form of one hashed field: None → "", anything else str()-ed and stripped."""
+    return "" if v is None else str(v).strip()
+
+
+# Every column either hash reads, each listed once.
+_KEY_COLUMNS = tuple(dict.fromkeys(RECORD_KEY_COLUMNS + ROW_HASH_COLUMNS))
+
+
+def _column_parts(df: pd.DataFrame, cols: tuple) -> dict:
+    """The _key_part string form of each of `cols`, as a Series per column."""
+    return {
+        c: df[c].map(_key_part) if c in df.columns else pd.Series("", index=df.index)
+        for c in cols
+    }
+
+
+def _joined_parts(parts: dict, cols: tuple) -> pd.Series:
+    """'|'-join the `cols` entries of `parts` for every row."""
+    first, *rest = (parts[c] for c in cols)
+    return first.str.cat(rest, sep="|")
+
+
+def _sha256_hex_many(payloads) -> list[str]:
+    """
+    Hex sha256 of each payload string, one OpenSSL call per message.
+
+    Every row's fields are already joined into a single buffer, so each
+    digest is one init/update/final round trip; this is the one place to
+    swap in a multi-buffer hasher if one becomes available.
+    """
+    _sha = sha256
+    return [_sha(s.encode("utf-8")).hexdigest() for s in payloads]
+
+
+def make_keys_frame(df: pd.DataFrame) -> tuple[pd.Series, pd.Series]:
+    """
+    (record_key, row_hash) Series for every row of `df`, with each shared
+    column converted to strings only once.
+    """
+    parts = _column_parts(df, _KEY_COLUMNS)
+    record_keys = _joined_parts(parts, RECORD_KEY_COLUMNS)
+    row_hashes = _joined_parts(parts, ROW_HASH_COLUMNS)
+    return (
+        pd.Series(_sha256_hex_many(record_keys), index=df.index),
+        pd.Series(_sha256_hex_many(row_hashes), index=df.index),
+    )
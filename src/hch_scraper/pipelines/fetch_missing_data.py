@@ -27,6 +27,33 @@ from hch_scraper.utils.data_extraction.form_helpers.selenium_utils import (
 )
 from hch_scraper.utils.data_extraction.table_extraction import transform_table
 
+# Columns that must be populated; a null in any marks the row for patching.
+KEY_COLS = (
+    "ACREDEED",
+    "SCHOOL_CODE_DIS",
+    "MKTLND",
+    "MKTIMP",
+    "MKT_TOTAL_VAL",
+    "ANNUAL_TAXES",
+)
+
+# Columns kept from each scraped table before the two are joined
+APPRAISAL_KEEP = ("Conveyance Number", "Deed Number", "Acreage")
+TAX_KEEP = (
+    "Market Land Value",
+    "Market Improvement Value",
+    "Market Total Value",
+)
+
+# Money/area columns scraped as text (e.g. "$12,345") that are stored as numbers
+PATCH_NUMERIC_COLS = (
+    "Acreage",
+    "Market Land Value",
+    "Market Improvement Value",
+    "Market Total Value",
+    "ANNUAL_TAXES",
+)
+
 
 def find_missing_rows(df: pd.DataFrame) -> Tuple[List[str], List[str]]:
     """
@@ -48,21 +75,17 @@ def find_missing_rows(df: pd.DataFrame) -> Tuple[List[str], List[str]]:
             - transfer_dates: list of values from 'transfer_date' corresponding
               to those same rows.
     """
-    # Filter rows where any of the required columns is null
-    key_cols = [
-        "ACREDEED",
-        "SCHOOL_CODE_DIS",
-        "MKTLND",
-        "MKTIMP",
-        "MKT_TOTAL_VAL",
-        "ANNUAL_TAXES",
-    ]
-
-    mask = df[key_cols].isnull().any(axis=1)
-
-    # Extract the parcel numbers and transfer dates for those rows
-    parcel_numbers = df.loc[mask, "parcel_number"].to_list()
-    transfer_dates = df.loc[mask, "transfer_date"].to_list()
+    # Filter rows where any of the required columns is null, folding one
+    # column's null mask at a time into a single (n,) boolean array
+    mask = np.zeros(len(df), dtype=bool)
+    for col in KEY_COLS:
+        mask |= df[col].isna().to_numpy()
+
+    # Extract the parcel numbers and transfer dates for those rows. Series
+    # boolean indexing keeps Timestamps boxed; ndarray.tolist() would turn
+    # datetime64 values into integer nanoseconds.
+    parcel_numbers = df["parcel_number"][mask].to_list()
+    transfer_dates = df["transfer_date"][mask].to_list()
 
     return parcel_numbers, transfer_dates
 
@@ -86,11 +109,11 @@ def extract_patched_property_details(driver, id, wait):
                 • added 'parcel_id' and 'school_district' columns
             - None if scraping fails or the table is empty.
     """
-    try:
-        if id == np.nan:
-            logger.warning(f"Parcel ID is {id}.")
-            return None
+    if id is None or pd.isna(id):
+        logger.warning("Parcel ID is missing; skipping detail scrape.")
+        return None
 
+    try:
         # 1. Scrape the appraisal table for this parcel
         appraisal_table = scrape_table_by_xpath(
             wait, XPATHS["view"]["appraisal_information"]
@@ -110,13 +133,7 @@ def extract_patched_property_details(driver, id, wait):
         appraisal_table = transform_table(appraisal_table)
         tax_table = transform_table(tax_table)
 
-        # 4. Drop columns we don’t need
-        appraisal_keep_cols = ["Conveyance Number", "Deed Number", "Acreage"]
-        appraisal_drop_list = [
-            c for c in appraisal_keep_cols if c not in appraisal_table.columns
-        ]
-        appraisal_table.drop(appraisal_drop_list, axis=1, inplace=True)
-
+        # 4. Keep only the columns we need
         appraisal_table["parcel_number"] = id
         appraisal_table["SCHOOL_CODE_DIS"] = get_text(
             driver, wait, XPATHS["property"]["school_district"]
@@ -124,18 +141,32 @@ def extract_patched_property_details(driver, id, wait):
         appraisal_table["ANNUAL_TAXES"] = get_text(
             driver, wait, XPATHS["property"]["annual_tax"]
         )
-
-        tax_keep_cols = [
-            "Market Land Value",
-            "Market Improvement Value",
-            "Market Total Value",
-        ]
-        tax_drop_list = [c for c in tax_keep_cols if c not in tax_table.columns]
-        tax_table.drop(tax_drop_list, axis=1, inplace=True)
+        appraisal_table = appraisal_table.reindex(
+            columns=[c for c in APPRAISAL_KEEP if c in appraisal_table.columns]
+            + ["parcel_number", "SCHOOL_CODE_DIS", "ANNUAL_TAXES"]
+        )
 
         tax_table["parcel_number"] = id
+        tax_table = tax_table.reindex(
+            columns=[c for c in TAX_KEEP if c in tax_table.columns]
+            + ["parcel_number"]
+        )
 
-        parcel_info = appraisal_table.merge(tax_table, on="parcel_number")
+        # Both tables carry the same single parcel key, so join on the index
+        # rather than running a hash merge.
+        parcel_info = (
+            appraisal_table.set_index("parcel_number")
+            .join(tax_table.set_index("parcel_number"), how="inner")
+            .reset_index()
+        )
+
+        # Parse money/area text into numbers while the frame is still tiny
+        for col in PATCH_NUMERIC_COLS:
+            if col in parcel_info.columns:
+                parcel_info[col] = pd.to_numeric(
+                    parcel_info[col].astype(str).str.replace(r"[$,]", "", regex=True),
+                    errors="coerce",
+                )
 
         # 5. Rename numeric count columns for clarity
         parcel_info.rename(
@@ -181,6 +212,11 @@ def patch_data(wait, driver, missing_id):
     Returns:
         pd.DataFrame or None: The patched appraisal DataFrame, or None on failure.
     """
+    # NaN/None IDs can't be searched; skip the form round-trip entirely
+    if missing_id is None or pd.isna(missing_id):
+        logger.warning("Parcel ID is missing; nothing to patch.")
+        return None
+
     # Focus the parcel ID input
     safe_click(wait, XPATHS["search"]["parcel_id"])
 
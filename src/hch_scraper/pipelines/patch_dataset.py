@@ -21,7 +21,6 @@ Workflow:
 import time
 import random
 from pathlib import Path
-import re
 
 import pandas as pd
 import geopandas as gpd
@@ -41,9 +40,12 @@ from hch_scraper.io.navigation import safe_click
 
 # Configuration constants
 from hch_scraper.config.settings import XPATHS, URLS
-from hch_scraper.config.mappings.street_types import street_type_map
 
-from hch_scraper.utils.data_extraction.address_cleaners import tag_address, add_zip_code
+from hch_scraper.utils.data_extraction.address_cleaners import (
+    tag_address,
+    add_zip_code,
+    replace_street_types,
+)
 
 # File I/O helper
 from hch_scraper.utils.data_extraction.form_helpers.file_io import get_file_path
@@ -117,10 +119,7 @@ if __name__ == "__main__":
     logger.info(
         "Beginning replacing of the street type (i.e. dr, rd, way, etc...) with the new mapping."
     )
-    pattern = r"\b(" + "|".join(map(re.escape, street_type_map.keys())) + r")\b"
-    merged["address"] = merged["address"].str.replace(
-        pattern, lambda m: street_type_map[m.group(0)], regex=True
-    )
+    merged["address"] = merged["address"].map(replace_street_types, na_action="ignore")
 
     # Address processing
     logger.info("Processing address columns for geocoding.")
@@ -174,10 +173,15 @@ if __name__ == "__main__":
     # 5. Prepare output file path
     output_path = homes_path.with_name("homes_all_patched.csv")
 
-    # 6. Loop over each parcel with missing data
+    # 6. Loop over each parcel with missing data. A parcel that sold more
+    # than once appears once per sale, but its details are scraped only once.
+    patched = {}
     for missing_id, transfer_date in zip(missing_ids, missing_dates):
         # Scrape the missing details for this parcel
-        property_info_table = patch_data(wait, driver, missing_id)
+        fetched = missing_id not in patched
+        if fetched:
+            patched[missing_id] = patch_data(wait, driver, missing_id)
+        property_info_table = patched[missing_id]
 
         # Build a boolean mask for the exact row to update
         mask = (merged["parcel_number"] == missing_id) & (
@@ -192,7 +196,8 @@ if __name__ == "__main__":
         logger.info(f"Patched parcel {missing_id} and saved to {output_path}")
 
         # Randomized delay to reduce server load and avoid being blocked
-        time.sleep(random.uniform(4, 8))
+        if fetched:
+            time.sleep(random.uniform(4, 8))
 
     # 7. Close the WebDriver when done
     driver.quit()
@@ -16,32 +16,49 @@ To run:
     $ python -m src.hch_scraper.main
 """
 
-import time
-import os
 import pandas as pd
-from datetime import datetime, date, timedelta
+from datetime import datetime, date
 from typing import List, Tuple
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, fields
 from dotenv import load_dotenv
-import numpy as np
-from supabase import create_client, Client
+from selenium.common.exceptions import WebDriverException
+from supabase import Client
 
 from hch_scraper.utils.logging_setup import logger
-from hch_scraper.config.settings import URLS
+from hch_scraper.config.settings import SCRAPING_CONFIG, URLS
 from hch_scraper.drivers.webdrivers import init_driver
-from hch_scraper.io.downloads import get_csv_data
+from hch_scraper.io.downloads import cache_window, get_csv_data, load_cached_window
 
-from hch_scraper.io.navigation import initialize_search, check_allowed_webscraping
+from hch_scraper.io.navigation import (
+    check_allowed_webscraping,
+    initialize_search,
+    wait_for_search_results,
+)
 from hch_scraper.utils.data_extraction.address_cleaners import (
+    AddressParts,
     normalize_address_parts,
     tag_address,
 )
-from hch_scraper.io.ingestion import upsert_sales_raw
+from hch_scraper.io.ingestion import null_non_finite, upsert_sales_raw
+from hch_scraper.io.supabase_client import get_supabase_client
 from hch_scraper.utils.data_extraction.form_helpers.selenium_utils import safe_quit
 from hch_scraper.utils.data_extraction.form_helpers.datetime_utils import (
     check_reset_needed,
+    to_iso_dates,
 )
 
+# Rows buffered across date ranges before they are upserted in one go
+UPSERT_FLUSH_ROWS = 1000
+
+# Browser restarts allowed for one window before the run gives up
+RETRY_LIMIT = SCRAPING_CONFIG["retry_limit"]
+
+# Columns _enrich_addresses adds, in AddressParts order
+ADDRESS_FIELDS = tuple(f.name for f in fields(AddressParts))
+
+# Row fields tag_address reads
+TAG_ADDRESS_COLUMNS = ("address", "parcel_number", "use", "bbb", "amount")
+
 
 @dataclass
 class Dates:
@@ -140,15 +157,6 @@ def run_scraper_for_dates(dates: Dates, robots_txt_allowed: bool) -> None:
     _scrape_all_dates(ranges, robots_txt_allowed, formatted_start, formatted_end)
 
 
-def _get_required_env(keys: List[str]) -> dict:
-    missing = [key for key in keys if not os.getenv(key)]
-    if missing:
-        raise ValueError(
-            f"Missing required environment variables: {', '.join(missing)}"
-        )
-    return {key: os.getenv(key) for key in keys}
-
-
 def _scrape_all_dates(
     ranges: List[Tuple[str, str]], robots_txt_allowed: bool, search_start, search_end
 ) -> None:
@@ -163,56 +171,133 @@ def _scrape_all_dates(
         pd.DataFrame: Combined DataFrame of all scraped data.
     """
 
-    env = _get_required_env(["SUPABASE_URL", "SUPABASE_SERVICE_ROLE_KEY"])
-    SUPABASE_URL = env["SUPABASE_URL"]
-    SUPABASE_SERVICE_ROLE_KEY = env["SUPABASE_SERVICE_ROLE_KEY"]
+    supabase: Client = get_supabase_client()
+    # Cleaned frames waiting to be upserted together.
+    pending: List[pd.DataFrame] = []
 
-    supabase: Client = create_client(SUPABASE_URL, SUPABASE_SERVICE_ROLE_KEY)
-
-    while ranges[:]:
-        for start, end in ranges[:]:
-            logger.info(f"Scraping from {start} to {end}")
-            all_data, updated_ranges, driver, modified = main(
-                robots_txt_allowed, ScrapeRequest(start, end, ranges)
-            )
-            ranges = updated_ranges
+    # One browser for the whole run, started on the first window that isn't
+    # cached; each window starts from a fresh page load instead of a fresh
+    # browser process.
+    driver = wait = None
+    # Browser failures in a row on the current window
+    failures = 0
+    try:
+        # main() pops each finished window off the front of `ranges`, or
+        # splits it in place when it holds too many results.
+        while ranges:
+            start, end = ranges[0]
+            cached = load_cached_window(start, end)
+            if cached is not None:
+                logger.info(
+                    "Using cached results for %s to %s: %d rows.",
+                    start,
+                    end,
+                    cached.shape[0],
+                )
+                ranges.pop(0)
+                all_data, modified = cached, False
+            else:
+                if driver is None:
+                    driver, wait = init_driver(URLS["base"])
+                    if not robots_txt_allowed:
+                        robots_txt_allowed = check_allowed_webscraping(driver)
+                        if not robots_txt_allowed:
+                            # check_allowed_webscraping has already quit the driver
+                            driver = None
+                            break
+
+                logger.info("Scraping from %s to %s", start, end)
+                try:
+                    all_data, ranges, driver, modified = main(
+                        robots_txt_allowed,
+                        ScrapeRequest(start, end, ranges),
+                        driver,
+                        wait,
+                    )
+                except WebDriverException as e:
+                    failures += 1
+                    if failures > RETRY_LIMIT:
+                        raise
+                    logger.warning(
+                        "Browser failed on %s to %s (%s); restarting it and retrying.",
+                        start,
+                        end,
+                        e,
+                    )
+                    safe_quit(driver)
+                    driver = wait = None
+                    continue
+                failures = 0
 
             if modified:
-                break
+                # The window was split or skipped in place; carry on from
+                # whatever is now at the front.
+                continue
+
+            if all_data.empty:
+                # Nothing to enrich or upsert, and an all-empty flush would
+                # have no parcel_number column to key on.
+                logger.info("No results for %s to %s.", start, end)
+                continue
 
             all_data, _addr_issues = _enrich_addresses(all_data)
 
             if "transfer_date" in all_data.columns:
-                all_data["transfer_date"] = pd.to_datetime(
-                    all_data["transfer_date"], errors="coerce"
-                ).dt.date.astype("string")
+                all_data["transfer_date"] = to_iso_dates(all_data["transfer_date"])
 
             # Convert everything to object and replace non-finite values with None
-            all_data = all_data.astype(object)
-            all_data = all_data.replace({np.nan: None, np.inf: None, -np.inf: None})
-
-            upsert_sales_raw(
-                df=all_data,
-                supabase=supabase,
-                schema_name="bronze",
-                table_name="sales_hamilton",
-            )
+            all_data = null_non_finite(all_data)
+
+            pending.append(all_data)
+            if sum(len(frame) for frame in pending) >= UPSERT_FLUSH_ROWS:
+                _upsert_pending(pending, supabase)
+    finally:
+        if driver is not None:
+            safe_quit(driver)
+
+    _upsert_pending(pending, supabase)
+
+
+def _upsert_pending(pending: List[pd.DataFrame], supabase: Client) -> None:
+    """
+    Upsert the buffered range frames as one frame and empty the buffer.
+
+    Args:
+        pending (List[pd.DataFrame]): Cleaned frames from one or more ranges.
+        supabase (Client): Authenticated Supabase client.
+    """
+    if not pending:
+        return
+    # Columns missing from some ranges come back as NaN from concat.
+    df = null_non_finite(pd.concat(pending, ignore_index=True))
+    upsert_sales_raw(
+        df=df,
+        supabase=supabase,
+        schema_name="bronze",
+        table_name="sales_hamilton",
+    )
+    pending.clear()
 
 
 def _enrich_addresses(df: pd.DataFrame) -> pd.DataFrame:
-    parsed = []
     issues = []
-    df.columns = df.columns.str.lower()
-    df.columns = df.columns.str.replace(" ", "_")
-    for _, row in df.iterrows():
+    df.columns = [c.lower().replace(" ", "_") for c in df.columns]
+    # Fill one preallocated list per AddressParts field rather than building
+    # a dict per row and having pandas union their keys.
+    cols = {name: [None] * len(df) for name in ADDRESS_FIELDS}
+    # Plain record dicts avoid building a boxed Series per row, and only
+    # the columns tag_address reads are boxed into them.
+    tag_cols = [c for c in TAG_ADDRESS_COLUMNS if c in df.columns]
+    for i, row in enumerate(df[tag_cols].to_dict(orient="records")):
         parts, errs = tag_address(row, addr_col="address", parcel_col="parcel_number")
         issues.extend(errs)
         if parts:
-            parsed.append(asdict(normalize_address_parts(parts)))
-        else:
-            parsed.append({})
-    enriched = pd.DataFrame(parsed)
-    return pd.concat([df.reset_index(drop=True), enriched], axis=1), issues
+            normalized = normalize_address_parts(parts)
+            for name in ADDRESS_FIELDS:
+                cols[name][i] = getattr(normalized, name)
+    enriched = pd.DataFrame(cols)
+    enriched_df = pd.concat([df.reset_index(drop=True), enriched], axis=1)
+    return enriched_df, issues
 
 
 def run_scraper_pipeline():
@@ -224,14 +309,9 @@ def run_scraper_pipeline():
     """
     load_dotenv()
     dates = get_user_input()
-    driver, wait = init_driver(URLS["base"])
 
-    try:
-        robots_txt_allowed = check_allowed_webscraping(driver)
-    finally:
-        safe_quit(driver)
-
-    run_scraper_for_dates(dates, robots_txt_allowed)
+    # robots.txt is checked on the scraping browser once it starts.
+    run_scraper_for_dates(dates, robots_txt_allowed=False)
 
 
 def _consolidate_data(existing: pd.DataFrame, new_data: pd.DataFrame) -> pd.DataFrame:
@@ -275,61 +355,95 @@ def _initialize_ranges(
     if start_dt > end_dt:
         raise ValueError("`start` must be on or before `end`.")
 
-    step = timedelta(days=window_days)
-    ranges = []
-
-    current_start = start_dt
-    while current_start < end_dt:
-        current_end = min(current_start + step, end_dt)
-        ranges.append((current_start.strftime(fmt), current_end.strftime(fmt)))
-        current_start += step + timedelta(days=1)
-    return ranges
+    # Each window starts the day after the previous one ends.
+    end_ts = pd.Timestamp(end_dt)
+    starts = pd.date_range(start_dt, end_dt, freq=f"{window_days + 1}D")
+    starts = starts[starts < end_ts]
+    ends = starts + pd.Timedelta(days=window_days)
+    ends = ends.where(ends <= end_ts, end_ts)
+    return list(zip(starts.strftime(fmt), ends.strftime(fmt)))
 
 
 def main(
-    robots_txt_allowed: bool, request: ScrapeRequest
+    robots_txt_allowed: bool,
+    request: ScrapeRequest,
+    driver: object = None,
+    wait: object = None,
 ) -> Tuple[pd.DataFrame, List[Tuple[str, str]], object, bool]:
     """
-    Initializes the web driver and performs scraping for a specific date range.
+    Performs scraping for a specific date range, on the given web driver or
+    on a new one that is closed afterwards.
 
     Args:
         robots_txt_allowed (bool): Flag indicating if scraping is allowed.
         request (ScrapeRequest): Structured input with start, end, and date ranges.
+        driver (WebDriver, optional): Driver to reuse; it is sent back to the
+            base URL first and left open.
+        wait (WebDriverWait, optional): Wait bound to `driver`.
 
     Returns:
         Tuple containing:
             - pd.DataFrame: The scraped data.
             - List[Tuple[str, str]]: Updated list of date ranges (if reset occurred).
             - object: Selenium WebDriver instance.
-            - bool: Whether reset was triggered (i.e., result count exceeded max).
+            - bool: Whether the window was split or skipped, leaving a new front range.
     """
 
     BASE_URL = URLS["base"]
-    driver, wait = init_driver(BASE_URL)
+
+    owns_driver = driver is None
+    if owns_driver:
+        driver, wait = init_driver(BASE_URL)
+    else:
+        driver.get(BASE_URL)
 
     if not robots_txt_allowed:
         robots_txt_allowed = check_allowed_webscraping(driver)
 
     try:
         initialize_search(wait, request.start, request.end)
-        time.sleep(2)
+        wait_for_search_results(wait)
         check = check_reset_needed(
             driver, wait, request.start, request.end, request.ranges
         )
         if check.reset_needed:
-            logger.info("Reset needed, closing WebDriver.")
+            if not check.total_entries:
+                # check_reset_needed has already dropped the empty window.
+                logger.info("No results for %s to %s.", request.start, request.end)
+                return pd.DataFrame(), check.dates, driver, check.modified
+
+            if not check.modified and check.dates[:1] == [(request.start, request.end)]:
+                # Too many results but the window can't be split further;
+                # skip it rather than retrying the same search forever.
+                logger.warning(
+                    "Could not split %s to %s; skipping it.", request.start, request.end
+                )
+                check.dates.pop(0)
+                return pd.DataFrame(), check.dates, driver, True
+
+            logger.info(
+                "Too many results for %s to %s (%d); splitting the window.",
+                request.start,
+                request.end,
+                check.total_entries,
+            )
             return pd.DataFrame(), check.dates, driver, check.modified
 
         data = get_csv_data(wait)
 
         logger.info(
-            f"Completed scraping for {request.start} to {request.end}: {data.shape[0]} rows."
+            "Completed scraping for %s to %s: %d rows.",
+            request.start,
+            request.end,
+            data.shape[0],
         )
+        cache_window(request.start, request.end, data)
         check.dates.pop(0)
         return data, check.dates, driver, check.modified
 
     finally:
-        safe_quit(driver)
+        if owns_driver:
+            safe_quit(driver)
 
 
 if __name__ == "__main__":
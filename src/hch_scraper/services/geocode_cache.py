@@ -0,0 +1,210 @@
+"""
+Persistent Geocode Cache
+
+SQLite-backed key/value store for PositionStack results. Results are keyed
+by a hash of the normalized address, so parcels that share an address share
+one API call, and a parcel → address-key index keeps lookups by parcel
+number working. Each result is written as it arrives, so a run no longer
+rewrites the whole cache file and an interrupted run keeps everything it
+fetched. Addresses the API can't resolve are remembered as misses for
+MISS_TTL_SECONDS so they aren't re-sent on every run.
+
+Usage:
+    from hch_scraper.services.geocode_cache import GeocodeCache, address_key
+    cache = GeocodeCache()
+    key = address_key("123 Main St, Cincinnati, OH 45202")
+    cache.put(key, {"latitude": 39.1, "longitude": -84.5}, parcel_number="0010001000100")
+    cache.get(key)
+    cache.get_for_parcel("0010001000100")
+    cache.put_miss(key)
+    cache.is_recent_miss(key)
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import re
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Optional
+
+import orjson
+
+from hch_scraper.config.settings import CACHE_PATHS
+from hch_scraper.utils.logging_setup import logger
+
+CACHE_PATH = CACHE_PATHS["geocoding_cache"]
+
+# Flat JSON file used before the SQLite store; imported once if present.
+LEGACY_JSON_PATH = "data/processed/geocode_cache.json"
+
+# Entries kept decoded in memory in front of SQLite
+MEMORY_CACHE_SIZE = 50_000
+
+# How long an unresolved address is left alone before it is asked about again
+MISS_TTL_SECONDS = 30 * 24 * 60 * 60
+
+WHITESPACE_RE = re.compile(r"\s+")
+
+
+def address_key(address: str) -> str:
+    """
+    Cache key for `address`: upper-cased, whitespace collapsed, hashed.
+
+    Args:
+        address (str): Free-form address string sent to the geocoder.
+
+    Returns:
+        str: 32-character hex digest.
+    """
+    normalized = WHITESPACE_RE.sub(" ", address.strip().upper())
+    return hashlib.blake2b(normalized.encode(), digest_size=16).hexdigest()
+
+
+class GeocodeCache:
+    """
+    Thread-safe key → geocode dict store on top of SQLite, with an in-memory
+    LRU of recently used entries in front of it.
+
+    Args:
+        path (str): SQLite database file; parent directories are created.
+        memory_size (int): Max entries held in the in-memory tier.
+    """
+
+    def __init__(self, path: str = CACHE_PATH, memory_size: int = MEMORY_CACHE_SIZE):
+        cache_dir = os.path.dirname(path)
+        if cache_dir:
+            os.makedirs(cache_dir, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._memory: OrderedDict[str, dict] = OrderedDict()
+        self._memory_size = memory_size
+        self._conn = sqlite3.connect(
+            path, isolation_level=None, check_same_thread=False
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS geocodes "
+            "(key TEXT PRIMARY KEY, geo BLOB NOT NULL)"
+        )
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS parcel_keys "
+            "(parcel TEXT PRIMARY KEY, key TEXT NOT NULL)"
+        )
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS misses "
+            "(key TEXT PRIMARY KEY, miss_at REAL NOT NULL)"
+        )
+        self._import_legacy_json()
+
+    def get(self, key: str) -> Optional[dict]:
+        """
+        Return the cached geocode for `key`, or None on a miss.
+        """
+        with self._lock:
+            geo = self._memory.get(key)
+            if geo is not None:
+                self._memory.move_to_end(key)
+                return geo
+
+            row = self._conn.execute(
+                "SELECT geo FROM geocodes WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            geo = orjson.loads(row[0])
+            self._remember(key, geo)
+        return geo
+
+    def get_for_parcel(self, parcel_number: str) -> Optional[dict]:
+        """
+        Return the geocode last stored for `parcel_number`, or None.
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT key FROM parcel_keys WHERE parcel = ?", (parcel_number,)
+            ).fetchone()
+        return self.get(row[0]) if row else None
+
+    def put(self, key: str, geo: dict, parcel_number: Optional[str] = None) -> None:
+        """
+        Insert or replace the geocode stored for `key`, optionally recording
+        that `parcel_number` resolves to it.
+        """
+        payload = orjson.dumps(geo)
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO geocodes (key, geo) VALUES (?, ?)",
+                (key, payload),
+            )
+            if parcel_number is not None:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO parcel_keys (parcel, key) VALUES (?, ?)",
+                    (parcel_number, key),
+                )
+            self._conn.execute("DELETE FROM misses WHERE key = ?", (key,))
+            self._remember(key, geo)
+
+    def put_miss(self, key: str) -> None:
+        """
+        Record that the geocoder returned nothing usable for `key` just now.
+        """
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO misses (key, miss_at) VALUES (?, ?)",
+                (key, time.time()),
+            )
+
+    def is_recent_miss(self, key: str, max_age: float = MISS_TTL_SECONDS) -> bool:
+        """
+        True if `key` was recorded as a miss less than `max_age` seconds ago.
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT miss_at FROM misses WHERE key = ?", (key,)
+            ).fetchone()
+        return row is not None and time.time() - row[0] < max_age
+
+    def __contains__(self, key: str) -> bool:
+        with self._lock:
+            if key in self._memory:
+                return True
+            row = self._conn.execute(
+                "SELECT 1 FROM geocodes WHERE key = ?", (key,)
+            ).fetchone()
+        return row is not None
+
+    def _remember(self, key: str, geo: dict) -> None:
+        # Caller holds self._lock.
+        self._memory[key] = geo
+        self._memory.move_to_end(key)
+        if len(self._memory) > self._memory_size:
+            self._memory.popitem(last=False)
+
+    def _import_legacy_json(self) -> None:
+        if not os.path.exists(LEGACY_JSON_PATH):
+            return
+        if self._conn.execute("SELECT 1 FROM geocodes LIMIT 1").fetchone():
+            return
+
+        with open(LEGACY_JSON_PATH, "rb") as f:
+            legacy = orjson.loads(f.read())
+
+        # The JSON cache was keyed by parcel and has no addresses, so each
+        # entry is stored under its parcel number and indexed to itself.
+        with self._lock:
+            self._conn.execute("BEGIN")
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO geocodes (key, geo) VALUES (?, ?)",
+                ((parcel, orjson.dumps(geo)) for parcel, geo in legacy.items()),
+            )
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO parcel_keys (parcel, key) VALUES (?, ?)",
+                ((parcel, parcel) for parcel in legacy),
+            )
+            self._conn.execute("COMMIT")
+        logger.info(f"Imported {len(legacy)} geocodes from {LEGACY_JSON_PATH}")
@@ -2,71 +2,212 @@
 Geocoding Utility for Address Enrichment
 
 This module geocodes address strings using the PositionStack API and caches
-results by parcel number to avoid redundant API calls. It supports batch
-processing and saves a persistent cache to disk for reuse across runs.
+results by normalized address to avoid redundant API calls. It supports batch
+processing and persists each result to disk as it is fetched.
 
 Features:
 - Uses `.env` file to load API key
-- Supports JSON-based caching
+- Caches results in SQLite (see geocode_cache)
 - Robust error handling
 - Designed for integration into a home sales scraping pipeline
 """
 
+import logging
 import os
-import json
+import threading
+import time
+import orjson
 import pandas as pd
-import http.client
-import urllib.parse
+import requests
 
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Optional
 from dotenv import load_dotenv
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from hch_scraper.config.settings import URLS
+from hch_scraper.services.geocode_cache import GeocodeCache, address_key
 from hch_scraper.utils.logging_setup import logger
 
 # Load environment variables
 load_dotenv()
 API_KEY = os.getenv("API_KEY")
 
-# API endpoint and cache location
+# API endpoint
 BASE_API_URL = URLS["geocoding_api"]
-CACHE_PATH = "data/processed/geocode_cache.json"
 
-
-# Load cache from disk if it exists
-def load_cache_from_disk(filepath=CACHE_PATH) -> dict:
+# Shared session so geocoding calls reuse keep-alive connections instead of
+# opening a new socket per parcel.
+_SESSION = requests.Session()
+_ADAPTER = HTTPAdapter(
+    pool_connections=32,
+    pool_maxsize=32,
+    # Only failed connects are retried here. 429/5xx responses and read
+    # timeouts come straight back so geocode_until_complete owns those
+    # retries, and each one goes through the rate limiter.
+    max_retries=Retry(total=2, connect=2, read=False, status=0, backoff_factor=0.25),
+)
+_SESSION.mount("http://", _ADAPTER)
+_SESSION.mount("https://", _ADAPTER)
+# Ask for compressed JSON explicitly; urllib3 decodes it transparently.
+_SESSION.headers.update(
+    {
+        "Accept": "application/json",
+        "Accept-Encoding": "gzip, deflate",
+        "Connection": "keep-alive",
+    }
+)
+
+# Ceiling on requests per second to positionstack; tune to the plan's quota.
+MAX_REQUESTS_PER_SECOND = 10
+
+# Attempts per parcel before a transient failure is treated as final
+MAX_GEOCODE_ATTEMPTS = 3
+
+
+class TransientGeocodingError(Exception):
+    """
+    Raised by get_geocodes when the request failed in a way worth retrying
+    (timeout, connection error, 429/5xx); nothing is cached in that case.
     """
-    Load previously saved geocoding results from a JSON file.
 
-    Args:
-        filepath (str): Path to the cache JSON file.
+    pass
 
-    Returns:
-        dict: Dictionary mapping parcel numbers to geocoding results.
-    """
-    if os.path.exists(filepath):
-        with open(filepath, "r") as f:
-            return json.load(f)
-    return {}
 
+class _TokenBucket:
+    """
+    Thread-safe token bucket that paces requests below the API quota.
 
-# Save updated cache to disk
-def save_cache_to_disk(cache: dict, filepath=CACHE_PATH):
+    The refill rate backs off multiplicatively when the API throttles us and
+    recovers additively on success (AIMD), so concurrent workers settle just
+    under the server's limit instead of bursting into 429s.
     """
-    Save geocoding cache to disk as a JSON file.
 
-    Args:
-        cache (dict): Dictionary containing geocoded parcel data.
-        filepath (str): File path to save the cache.
+    def __init__(self, rate: float, min_rate: float = 1.0):
+        self.max_rate = rate
+        self.min_rate = min_rate
+        self.rate = rate
+        self._tokens = rate
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Block until a request may be sent."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(
+                    self.rate, self._tokens + (now - self._updated) * self.rate
+                )
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                delay = (1 - self._tokens) / self.rate
+            time.sleep(delay)
+
+    def throttled(self) -> None:
+        """Halve the rate after a 429."""
+        with self._lock:
+            self.rate = max(self.min_rate, self.rate * 0.5)
+        logger.info(f"Geocoding rate reduced to {self.rate:.1f} req/s")
+
+    def succeeded(self) -> None:
+        """Creep the rate back up after an unthrottled response."""
+        with self._lock:
+            self.rate = min(self.max_rate, self.rate + 0.5)
+
+
+_LIMITER = _TokenBucket(MAX_REQUESTS_PER_SECOND)
+
+# How long to pause when the quota headers say we're nearly out but give no
+# Retry-After; positionstack's burst limits are per second.
+QUOTA_PAUSE_SECONDS = 1.0
+
+
+@dataclass
+class _Quota:
+    """Rate-limit state reported by the API on the most recent response."""
+
+    limit: Optional[int] = None
+    remaining: Optional[int] = None
+    resume_at: float = 0.0  # time.monotonic() before which we should not send
+
+
+_QUOTA = _Quota()
+_quota_lock = threading.Lock()
+
+
+def _header_int(headers, name: str) -> Optional[int]:
+    try:
+        return int(float(headers[name]))
+    except (KeyError, TypeError, ValueError):
+        return None
+
+
+def _record_quota(resp: requests.Response) -> None:
+    """
+    Read X-RateLimit-* and Retry-After from `resp` and schedule a pause if
+    the quota is nearly spent, before the API starts rejecting requests.
     """
-    cache_dir = os.path.dirname(filepath)
-    if cache_dir:
-        os.makedirs(cache_dir, exist_ok=True)
-    with open(filepath, "w") as f:
-        json.dump(cache, f)
+    limit = _header_int(resp.headers, "X-RateLimit-Limit")
+    remaining = _header_int(resp.headers, "X-RateLimit-Remaining")
+    retry_after = _header_int(resp.headers, "Retry-After")
+
+    with _quota_lock:
+        _QUOTA.limit = limit if limit is not None else _QUOTA.limit
+        _QUOTA.remaining = remaining
+        pause = None
+        if retry_after is not None:
+            pause = retry_after
+        elif remaining is not None and remaining <= max(2, 0.1 * (_QUOTA.limit or 0)):
+            pause = QUOTA_PAUSE_SECONDS
+        if pause is not None:
+            _QUOTA.resume_at = max(_QUOTA.resume_at, time.monotonic() + pause)
+            logger.info(f"Geocoding quota low ({remaining} left); pausing {pause}s")
+
+
+def _wait_for_quota() -> None:
+    """Sleep until any pause scheduled by _record_quota has elapsed."""
+    with _quota_lock:
+        delay = _QUOTA.resume_at - time.monotonic()
+    if delay > 0:
+        time.sleep(delay)
+
+
+@lru_cache(maxsize=1)
+def get_geocode_cache() -> GeocodeCache:
+    """
+    Persistent cache, opened on first use so importing this module doesn't
+    create directories or a SQLite file. Each result is written as soon as
+    it is fetched.
+    """
+    return GeocodeCache()
+
+
+def __getattr__(name):
+    # Keeps `geocoding.geocode_cache` working without opening it at import.
+    if name == "geocode_cache":
+        return get_geocode_cache()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
-# In-memory cache
-geocode_cache = load_cache_from_disk()
+# DataFrame column → key in the dict returned by get_geocodes
+GEO_COLUMNS = {
+    "formatted_address": "formatted_address",
+    "lon": "longitude",
+    "lat": "latitude",
+    "house_num": "house_num",
+    "street_name": "street_name",
+    "api_city": "api_city",
+    "county": "county",
+    "api_state": "api_state",
+    "api_postal_code": "api_postal_code",
+    "confidence": "confidence",
+}
 
 
 def get_geocodes(address: str, parcel_number: str) -> dict:
@@ -75,35 +216,60 @@ def get_geocodes(address: str, parcel_number: str) -> dict:
 
     Args:
         address (str): The street address to geocode.
-        parcel_number (str): Unique parcel number used as cache key.
+        parcel_number (str): Parcel number, indexed to the address's cache entry.
 
     Returns:
         dict: Dictionary of geocoding results (lat/lon, ZIP, confidence, etc.)
+
+    Raises:
+        TransientGeocodingError: On timeouts, connection errors or 429/5xx
+            responses; the result is not cached so the parcel can be retried.
     """
     if not API_KEY:
         raise ValueError("Missing API_KEY environment variable for geocoding.")
 
-    if parcel_number in geocode_cache:
-        return geocode_cache[parcel_number]
-
-    conn = http.client.HTTPConnection("api.positionstack.com")
-    params = urllib.parse.urlencode(
-        {
-            "access_key": API_KEY,
-            "query": address,
-            "region": "Ohio",
-            "country": "US",
-            "limit": 1,
-        }
-    )
+    # Same address → same result, whichever parcel asks; fall back to what
+    # this parcel resolved to before (e.g. entries from the old JSON cache).
+    key = address_key(address)
+    geocode_cache = get_geocode_cache()
+    cached = geocode_cache.get(key)
+    if cached is None:
+        cached = geocode_cache.get_for_parcel(parcel_number)
+    if cached is not None:
+        return cached
+    if geocode_cache.is_recent_miss(key):
+        return dict.fromkeys(GEO_COLUMNS.values())
+
+    params = {
+        "access_key": API_KEY,
+        "query": address,
+        "region": "Ohio",
+        "country": "US",
+        "limit": 1,
+    }
+
+    _wait_for_quota()
+    _LIMITER.acquire()
+    try:
+        resp = _SESSION.get(BASE_API_URL, params=params, timeout=(3.05, 10))
+    except (requests.Timeout, requests.ConnectionError) as e:
+        raise TransientGeocodingError(f"parcel {parcel_number}: {e}") from e
+
+    _record_quota(resp)
+    if resp.status_code == 429:
+        _LIMITER.throttled()
+    else:
+        _LIMITER.succeeded()
+    if resp.status_code == 429 or resp.status_code >= 500:
+        raise TransientGeocodingError(
+            f"parcel {parcel_number}: HTTP {resp.status_code}"
+        )
 
     try:
-        conn.request("GET", f"/v1/forward?{params}")
-        resp = conn.getresponse()
-        data = resp.read()
-        conn.close()
-        logger.debug(data.decode("utf-8"))
-        data = json.loads(data.decode("utf-8"))
+        # resp.text decodes the whole payload; only pay for it when debugging.
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(resp.text[:512])
+        data = orjson.loads(resp.content)
 
         if data.get("data"):
             hit = data["data"][0]
@@ -126,48 +292,29 @@ def get_geocodes(address: str, parcel_number: str) -> dict:
                 "confidence": hit.get("confidence"),
             }
         else:
-            geocode = {
-                k: None
-                for k in [
-                    "formatted_address",
-                    "longitude",
-                    "latitude",
-                    "house_num",
-                    "street_name",
-                    "api_city",
-                    "county",
-                    "api_state",
-                    "api_postal_code",
-                    "confidence",
-                ]
-            }
+            geocode = dict.fromkeys(GEO_COLUMNS.values())
     except Exception as e:
-        logger.warning(f"Geocoding error for parcel {parcel_number}: {e}")
-        geocode = {
-            k: None
-            for k in [
-                "formatted_address",
-                "longitude",
-                "latitude",
-                "house_num",
-                "street_name",
-                "api_city",
-                "county",
-                "api_state",
-                "api_postal_code",
-                "confidence",
-            ]
-        }
-
-    # Save result to in-memory cache
-    geocode_cache[parcel_number] = geocode
+        logger.warning("Geocoding error for parcel %s: %s", parcel_number, e)
+        geocode = dict.fromkeys(GEO_COLUMNS.values())
+
+    # Save result to the persistent cache. An empty or unparseable response
+    # is kept as a miss instead, so it is retried only once the miss expires.
+    if any(v is not None for v in geocode.values()):
+        geocode_cache.put(key, geocode, parcel_number=parcel_number)
+    else:
+        geocode_cache.put_miss(key)
     return geocode
 
 
 def geocode_until_complete(df: pd.DataFrame, batchsize: int = 10) -> pd.DataFrame:
     """
-    Iteratively geocode rows in the DataFrame that lack latitude/longitude,
-    using PositionStack and a persistent cache.
+    Geocode rows in the DataFrame that lack latitude/longitude, using
+    PositionStack and a persistent cache.
+
+    Parcels missing coordinates are collected once into a pending set. Each
+    round geocodes everything still pending; parcels that fail transiently
+    stay pending and are retried after an exponential backoff, up to
+    MAX_GEOCODE_ATTEMPTS, while everything else leaves the set after one try.
 
     Args:
         df (pd.DataFrame): The DataFrame containing 'parcel_number' and 'new_address'.
@@ -176,48 +323,68 @@ def geocode_until_complete(df: pd.DataFrame, batchsize: int = 10) -> pd.DataFram
     Returns:
         pd.DataFrame: The enriched DataFrame with geocoded columns filled in.
     """
-    logger.info(f"Starting geocoding loop on {df.shape[0]} rows")
+    logger.info(f"Starting geocoding on {df.shape[0]} rows")
+    # Open the cache here so the worker threads don't race to create it.
+    get_geocode_cache()
+
+    # Index rows by parcel so each result is a hashed .loc lookup rather than
+    # a full-column comparison; the caller's index is restored on return.
+    original_index = df.index
+    df = df.set_index(df["parcel_number"].rename(None))
+
+    mask = df[["lat", "lon"]].isna().any(axis=1).to_numpy()
+    pending = dict(
+        df.loc[mask, ["parcel_number", "new_address"]].itertuples(
+            index=False, name=None
+        )
+    )
+    attempts = {parcel_number: 0 for parcel_number in pending}
 
-    stall_counter = 0
-    while df["lat"].isna().any() or df["lon"].isna().any():
-        before = df["lat"].isna().sum()
-        to_geocode = df[df["lat"].isna() | df["lon"].isna()]
-        home_dict = dict(zip(to_geocode["parcel_number"], to_geocode["new_address"]))
-        logger.info(f"Remaining to geocode: {len(home_dict)} parcels.")
+    round_num = 0
+    while pending:
+        if round_num:
+            # Only transient failures are left; give the API room to recover.
+            time.sleep(min(0.5 * (1 << (round_num - 1)), 8))
+        round_num += 1
+        logger.info("Remaining to geocode: %d parcels.", len(pending))
 
-        keys = list(home_dict.keys())
+        keys = list(pending)
         for i in range(0, len(keys), batchsize):
             batch_keys = keys[i : i + batchsize]
-            for parcel_number in batch_keys:
-                address = home_dict[parcel_number]
-                try:
-                    geo = get_geocodes(address, parcel_number)
-                    sel = df["parcel_number"] == parcel_number
-                    cols = [
-                        "formatted_address",
-                        "lon",
-                        "lat",
-                        "house_num",
-                        "street_name",
-                        "api_city",
-                        "county",
-                        "api_state",
-                        "api_postal_code",
-                        "confidence",
-                    ]
-                    df.loc[sel, cols] = [geo[col] for col in cols]
-                except Exception as e:
-                    logger.warning(f"Failed to geocode parcel {parcel_number}: {e}")
-
-        after = df["lat"].isna().sum()
-        if after == before:
-            stall_counter += 1
-            if stall_counter >= 2:
-                logger.warning("Geocoding stalled; exiting loop.")
-                break
-        else:
-            stall_counter = 0
-
-    save_cache_to_disk(geocode_cache)
-    logger.info("Geocoding loop completed")
+            # Requests are I/O bound, so run the batch concurrently and
+            # collect results as they arrive.
+            results = {}
+            with ThreadPoolExecutor(max_workers=batchsize) as ex:
+                futures = {
+                    ex.submit(get_geocodes, pending[p], p): p for p in batch_keys
+                }
+                for future in as_completed(futures):
+                    parcel_number = futures[future]
+                    attempts[parcel_number] += 1
+                    try:
+                        geo = future.result()
+                    except TransientGeocodingError as e:
+                        if attempts[parcel_number] < MAX_GEOCODE_ATTEMPTS:
+                            continue
+                        logger.warning(
+                            "Giving up on parcel %s after %d attempts: %s",
+                            parcel_number,
+                            attempts[parcel_number],
+                            e,
+                        )
+                    except Exception as e:
+                        logger.warning("Failed to geocode parcel %s: %s", parcel_number, e)
+                    else:
+                        results[parcel_number] = [geo[key] for key in GEO_COLUMNS.values()]
+                    del pending[parcel_number]
+
+            # One columnar write per batch instead of a .loc assignment per parcel.
+            if results:
+                updates = pd.DataFrame.from_dict(
+                    results, orient="index", columns=list(GEO_COLUMNS)
+                )
+                df.update(updates)
+
+    logger.info("Geocoding completed")
+    df.index = original_index
     return df
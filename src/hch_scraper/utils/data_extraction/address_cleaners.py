@@ -1,5 +1,7 @@
 import re
+import sys
 from dataclasses import dataclass, asdict
+from functools import lru_cache
 from typing import Optional, Tuple, List
 
 import pandas as pd
@@ -9,6 +11,7 @@ from word2number import w2n
 import logging
 
 from hch_scraper.config.mappings.street_types import (
+    street_type_map,
     street_suffix_normalization_map,
     direction_normalization_map,
     direction_abbrev_to_full,
@@ -50,6 +53,12 @@ DECIMAL_DOT = re.compile(r"(?<=\d)\.(?=\d)")  # dot between digits
 PROTECT = "⟐"  # any rare placeholder char
 UNIT_LETTER_RE = re.compile(r"^(\d+)\s+([A-DF-MO-VX-Z]{1}[-]?\d+?)\s+(.+)$")
 ALPHANUMERIC = re.compile(r'[A-DF-MO-VX-Z]{1}[-]?\d+?')
+# Longest spellings first so "AVEN" is tried before "AV" without backtracking.
+STREET_TYPE_RE = re.compile(
+    r"\b("
+    + "|".join(map(re.escape, sorted(street_type_map, key=len, reverse=True)))
+    + r")\b"
+)
 
 # ─────────────────────────────────────────────────────────────────────────────
 # Property Use Type Dictionaries
@@ -141,6 +150,10 @@ def _safe_int(x) -> Optional[int]:
             cleaned = x.strip().replace("$", "").replace(",", "")
             if cleaned == "":
                 return None
+            # Plain integers are the common case; skip the float round-trip
+            # (and the exception path) for them.
+            if cleaned.isdecimal():
+                return int(cleaned)
             return int(float(cleaned))
 
         # numpy, floats, decimals
@@ -280,7 +293,7 @@ def tag_address(
     parcel_col: str,
 ) -> Tuple[Optional[AddressParts], List[str]]:
     """
-    row         : one DataFrame row (Series)
+    row         : one DataFrame row (Series or record dict)
     addr_col    : name of the address column in that row
     parcel_col  : name of the parcel-number column
     """
@@ -389,7 +402,7 @@ def normalize_address_parts(parts: AddressParts) -> AddressParts:
     # Address number
     new_num = _coerce_address_number(parts.AddressNumber)
     if new_num != parts.AddressNumber:
-        logger.debug(f"AddressNumber normalized: {parts.AddressNumber} → {new_num}")
+        logger.debug("AddressNumber normalized: %s → %s", parts.AddressNumber, new_num)
     data["AddressNumber"] = new_num
 
     # Pre-direction
@@ -397,7 +410,7 @@ def normalize_address_parts(parts: AddressParts) -> AddressParts:
         raw = parts.StreetNamePreDirectional.upper().rstrip(".")
         normalized = direction_abbrev_to_full.get(direction_normalization_map.get(raw, raw), raw)
         if normalized != raw:
-            logger.debug(f"PreDirectional normalized: {raw} → {normalized}")
+            logger.debug("PreDirectional normalized: %s → %s", raw, normalized)
         data["StreetNamePreDirectional"] = normalized
         # Pre-direction
 
@@ -409,7 +422,7 @@ def normalize_address_parts(parts: AddressParts) -> AddressParts:
         raw = parts.StreetNamePostDirectional.upper().rstrip(".")
         normalized = direction_abbrev_to_full.get(direction_normalization_map.get(raw, raw), raw)
         if normalized != raw:
-            logger.debug(f"PostDirectional normalized: {raw} → {normalized}")
+            logger.debug("PostDirectional normalized: %s → %s", raw, normalized)
         data["StreetNamePostDirectional"] = normalized
 
     # Suffix
@@ -417,7 +430,7 @@ def normalize_address_parts(parts: AddressParts) -> AddressParts:
         raw = parts.StreetNamePostType.upper().rstrip(".")
         normalized = street_suffix_normalization_map.get(raw)
         if normalized != raw:
-            logger.debug(f"Suffix normalized: {raw} → {normalized}")
+            logger.debug("Suffix normalized: %s → %s", raw, normalized)
         data["StreetNamePostType"] = normalized
 
     # Unit
@@ -425,17 +438,17 @@ def normalize_address_parts(parts: AddressParts) -> AddressParts:
         raw = parts.OccupancyType.upper().rstrip(".")
         normalized = secondary_unit_normalization_map.get(raw)
         if normalized != raw:
-            logger.debug(f"UnitType normalized: {raw} → {normalized}")
+            logger.debug("UnitType normalized: %s → %s", raw, normalized)
         data["OccupancyType"] = normalized
 
     # City/State
     if parts.PlaceName and parts.PlaceName.upper() != parts.PlaceName:
-        logger.debug(f"City uppercased: {parts.PlaceName} → {parts.PlaceName.upper()}")
         data["PlaceName"] = parts.PlaceName.upper()
+        logger.debug("City uppercased: %s → %s", parts.PlaceName, data["PlaceName"])
 
     if parts.StateName and parts.StateName.upper() != parts.StateName:
-        logger.debug(f"State uppercased: {parts.StateName} → {parts.StateName.upper()}")
         data["StateName"] = parts.StateName.upper()
+        logger.debug("State uppercased: %s → %s", parts.StateName, data["StateName"])
 
     return AddressParts(**data)
 
@@ -445,6 +458,22 @@ def normalize_address_parts(parts: AddressParts) -> AddressParts:
 # ─────────────────────────────────────────────────────────────────────────────
 
 
+@lru_cache(maxsize=200_000)
+def replace_street_types(addr: str) -> str:
+    """
+    Rewrite every street-type token in `addr` to its canonical suffix
+    (e.g. 'OAK AVE' -> 'OAK AVENUE') in a single regex pass.
+
+    Cached because the same street addresses recur across many sales rows;
+    results are interned so repeated values share one string object.
+    """
+    return sys.intern(STREET_TYPE_RE.sub(_street_type_repl, addr))
+
+
+def _street_type_repl(m: re.Match) -> str:
+    return street_type_map[m.group(0)]
+
+
 def _collapse_fraction(m: re.Match) -> str:
     whole, num, den = m.groups()
     value = int(whole) + int(num) / int(den)  # 915 + 1/2 → 915.5
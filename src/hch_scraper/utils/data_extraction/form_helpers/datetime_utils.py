@@ -207,6 +207,28 @@ def check_reset_needed(
     )
 
 
+def to_iso_dates(values: pd.Series, fmt: str = "%m/%d/%Y") -> pd.Series:
+    """
+    Parse scraped transfer dates into YYYY-MM-DD strings.
+
+    Values matching `fmt` are parsed with that fixed format, which skips
+    per-value format inference; anything else falls back to the inferred
+    parse. Unparseable values become missing.
+
+    Args:
+        values (pd.Series): Raw date values as scraped.
+        fmt (str): Expected input format.
+
+    Returns:
+        pd.Series: ISO date strings, with missing values for bad input.
+    """
+    parsed = pd.to_datetime(values, format=fmt, errors="coerce", cache=True)
+    retry = parsed.isna() & values.notna()
+    if retry.any():
+        parsed[retry] = pd.to_datetime(values[retry], errors="coerce")
+    return parsed.dt.strftime("%Y-%m-%d").astype("string")
+
+
 def _ensure_datetime(value: Any, description: str = "date") -> datetime:
     if isinstance(value, datetime):
         return value
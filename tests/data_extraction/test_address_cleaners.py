@@ -8,7 +8,8 @@ from hch_scraper.utils.data_extraction.address_cleaners import (
     tag_address,
     normalize_address_parts,
     _preclean,
-    _coerce_address_number
+    _coerce_address_number,
+    replace_street_types,
 )
 
 # ─────────────────────────────────────────────────────────
@@ -200,6 +201,12 @@ def test_coerce_address_number_words_to_numeric(input_value, expected):
     assert _coerce_address_number(input_value) == expected
 
 
+def test_replace_street_types_prefers_longest_spelling():
+    assert replace_street_types("123 OAK AVE") == "123 OAK AVENUE"
+    assert replace_street_types("10 AVEN RD") == "10 AVENUE ROAD"
+    assert replace_street_types("4951 N ARBOR WOODS CT") == "4951 N ARBOR WOODS COURT"
+
+
 def test_coerce_address_number_leaves_unparseable_values():
     """
     If word_to_num can't parse it, we should just return the original value.
@@ -42,3 +42,9 @@ def test_coerce_address_number_words():
     assert ac._coerce_address_number("one hundred twenty three") == "123"
 
 
+def test_safe_int_plain_and_formatted_strings():
+    assert ac._safe_int("1234") == 1234
+    assert ac._safe_int(" $123,456 ") == 123456
+    assert ac._safe_int("550.0") == 550
+    assert ac._safe_int("") is None
+    assert ac._safe_int("N/A") is None
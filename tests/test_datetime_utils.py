@@ -1,3 +1,5 @@
+import pandas as pd
+
 from hch_scraper.utils.data_extraction.form_helpers import datetime_utils as du
 
 
@@ -76,3 +78,13 @@ def test_check_reset_needed_retries_until_count_available(monkeypatch):
     assert calls["n"] == 3
     assert result.reset_needed is True
     assert result.total_entries == 1000
+
+
+def test_to_iso_dates_parses_fixed_format_and_falls_back():
+    values = pd.Series(["02/20/2026", "2026-03-01", "not a date", None])
+
+    result = du.to_iso_dates(values)
+
+    assert result.iloc[0] == "2026-02-20"
+    assert result.iloc[1] == "2026-03-01"
+    assert result.iloc[2:].isna().all()
@@ -0,0 +1,50 @@
+import os
+import time
+from datetime import date, timedelta
+
+import pandas as pd
+
+from hch_scraper.io import downloads
+
+
+def _enable_cache(monkeypatch, tmp_path):
+    monkeypatch.setattr(downloads, "WINDOW_CACHE_DIR", str(tmp_path))
+    monkeypatch.setenv(downloads.WINDOW_CACHE_ENV, "1")
+
+
+def test_window_cache_round_trip_and_expiry(tmp_path, monkeypatch):
+    _enable_cache(monkeypatch, tmp_path)
+    df = pd.DataFrame({"Parcel Number": ["600-0010-0001-00"], "Amount": [125000]})
+
+    assert downloads.load_cached_window("01/01/2026", "01/07/2026") is None
+
+    downloads.cache_window("01/01/2026", "01/07/2026", df)
+    cached = downloads.load_cached_window("01/01/2026", "01/07/2026")
+    pd.testing.assert_frame_equal(cached, df)
+
+    path = downloads._window_cache_path("01/01/2026", "01/07/2026")
+    stale = time.time() - downloads.WINDOW_CACHE_MAX_AGE - 60
+    os.utime(path, (stale, stale))
+    assert downloads.load_cached_window("01/01/2026", "01/07/2026") is None
+    assert not path.exists()
+
+
+def test_window_cache_is_off_by_default(tmp_path, monkeypatch):
+    monkeypatch.setattr(downloads, "WINDOW_CACHE_DIR", str(tmp_path))
+    monkeypatch.delenv(downloads.WINDOW_CACHE_ENV, raising=False)
+    df = pd.DataFrame({"Parcel Number": ["600-0010-0001-00"]})
+
+    downloads.cache_window("01/01/2026", "01/07/2026", df)
+    assert list(tmp_path.iterdir()) == []
+    assert downloads.load_cached_window("01/01/2026", "01/07/2026") is None
+
+
+def test_recent_windows_are_never_cached(tmp_path, monkeypatch):
+    _enable_cache(monkeypatch, tmp_path)
+    df = pd.DataFrame({"Parcel Number": ["600-0010-0001-00"]})
+    start = (date.today() - timedelta(days=7)).strftime("%m/%d/%Y")
+    end = date.today().strftime("%m/%d/%Y")
+
+    downloads.cache_window(start, end, df)
+    assert list(tmp_path.iterdir()) == []
+    assert downloads.load_cached_window(start, end) is None
@@ -0,0 +1,16 @@
+from hch_scraper.services.geocode_cache import GeocodeCache, address_key
+
+
+def test_misses_expire_and_are_cleared_by_a_hit(tmp_path):
+    cache = GeocodeCache(path=str(tmp_path / "geocodes.sqlite3"))
+    key = address_key("1 Nowhere Ln, Cincinnati, OH")
+
+    assert not cache.is_recent_miss(key)
+
+    cache.put_miss(key)
+    assert cache.is_recent_miss(key)
+    assert not cache.is_recent_miss(key, max_age=0)
+
+    cache.put(key, {"latitude": 39.1, "longitude": -84.5})
+    assert not cache.is_recent_miss(key)
+    assert cache.get(key) == {"latitude": 39.1, "longitude": -84.5}
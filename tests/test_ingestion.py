@@ -0,0 +1,20 @@
+import numpy as np
+import pandas as pd
+
+from hch_scraper.io.ingestion import null_non_finite
+
+
+def test_null_non_finite_replaces_missing_and_infinite_cells():
+    df = pd.DataFrame(
+        {
+            "amount": [125000.0, np.nan, np.inf, -np.inf],
+            "use": [510, 550, 510, 550],
+            "address": ["1 MAIN ST", None, "", np.nan],
+        }
+    )
+
+    cleaned = null_non_finite(df)
+
+    assert cleaned["amount"].tolist() == [125000.0, None, None, None]
+    assert cleaned["use"].tolist() == [510, 550, 510, 550]
+    assert cleaned["address"].tolist() == ["1 MAIN ST", None, "", None]